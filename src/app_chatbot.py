@@ -15,7 +15,7 @@ from src.services.chat_history_manager import ChatHistoryManager, MessageType
 from src.services.scroll_retriever import ScrollRetriever
 from src.services.profile_manager import ProfileManager
 from src.services.review_agent.review_agent import ReviewAgent
-from src.utils.logging_utils import log
+from src.utils.logging_utils import log, ERROR
 import pyperclip
 
 def mask_key(key):
@@ -36,7 +36,7 @@ def initialize_services():
     log(f"Loaded config: provider={config.provider}, model={config.openai_model}, api_key={mask_key(config.openai_api_key)}")
     if not config.validate():
         st.error("⚠️ OpenAI API key is required. Please set it in the sidebar.")
-        log("ERROR: OpenAI API key is missing or invalid.")
+        log("ERROR: OpenAI API key is missing or invalid.", level=ERROR)
         return None, None, None, None, None, None
     try:
         llm_service = LLMService(config)
@@ -48,7 +48,7 @@ def initialize_services():
         return config, llm_service, chat_history_manager, prompt_builder, scroll_retriever, review_agent
     except Exception as e:
         st.error(f"❌ Failed to initialize services: {e}")
-        log(f"ERROR initializing services: {e}\n{traceback.format_exc()}")
+        log(f"ERROR initializing services: {e}\n{traceback.format_exc()}", level=ERROR)
         return None, None, None, None, None, None
 
 def render_configuration_sidebar(config):
@@ -142,7 +142,7 @@ def render_chat_interface(chat_history_manager, prompt_builder, review_agent):
                         review_result = review_agent.review_email(draft)
                         st.session_state['current_feedback'] = review_result
                     except Exception as e:
-                        log(f"ERROR generating feedback: {e}", prefix="Hedwig")
+                        log(f"ERROR generating feedback: {e}", prefix="Hedwig", level=ERROR)
                         st.session_state['current_feedback'] = None
                     col1, col2 = st.columns(2)
                     with col1:
@@ -152,7 +152,7 @@ def render_chat_interface(chat_history_manager, prompt_builder, review_agent):
                                 st.success("✅ Email copied to clipboard!")
                             except Exception as e:
                                 st.error(f"❌ Failed to copy: {e}")
-                                log(f"ERROR copying to clipboard: {e}", prefix="Hedwig")
+                                log(f"ERROR copying to clipboard: {e}", prefix="Hedwig", level=ERROR)
                     with col2:
                         if st.button("🔄 Regenerate", key="regenerate_btn"):
                             st.session_state['regenerate'] = True
@@ -163,7 +163,7 @@ def render_chat_interface(chat_history_manager, prompt_builder, review_agent):
                     st.session_state['feedback_loading'] = False
             except Exception as e:
                 st.error(f"❌ Error generating draft: {e}")
-                log(f"ERROR generating draft: {e}", prefix="Hedwig")
+                log(f"ERROR generating draft: {e}", prefix="Hedwig", level=ERROR)
                 # Clear feedback loading flag on error
                 st.session_state['feedback_loading'] = False
             st.session_state['regenerate'] = False
@@ -222,7 +222,7 @@ def render_email_actions(email_content):
                 st.success("✅ Email copied to clipboard!")
             except Exception as e:
                 st.error(f"❌ Failed to copy: {e}")
-                log(f"ERROR copying to clipboard: {e}", prefix="Hedwig")
+                log(f"ERROR copying to clipboard: {e}", prefix="Hedwig", level=ERROR)
     
     with col2:
         if st.button("🔄 Regenerate"):
@@ -373,7 +373,7 @@ def main():
                 
         except Exception as e:
             st.error(f"❌ Failed to reinitialize services: {e}")
-            log(f"ERROR reinitializing services: {e}\n{traceback.format_exc()}", prefix="Hedwig")
+            log(f"ERROR reinitializing services: {e}\n{traceback.format_exc()}", prefix="Hedwig", level=ERROR)
             st.stop()
     
     # Render main chat interface
@@ -1,8 +1,6 @@
 import os
 from typing import Optional, Dict, Any
 from pathlib import Path
-from dotenv import load_dotenv
-import json
 
 from ..utils.logging_utils import log
 from ..utils.file_utils import FileUtils
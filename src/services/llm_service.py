@@ -1,5 +1,4 @@
 from typing import Dict, Optional, Any, Tuple
-import openai
 from .config_service import AppConfig
 import os
 from .config_service import get_config
@@ -23,6 +22,9 @@ class LLMService:
             api_key = self.config.get_api_key()
             if not api_key:
                 raise ValueError("OpenAI API key is required")
+            # Imported here so the SDK is only loaded once a client is needed
+            import openai
+            
             # New OpenAI API (1.0.0+) uses client-based approach
             self.client = openai.OpenAI(api_key=api_key)
         # Future providers would be added here
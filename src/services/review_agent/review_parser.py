@@ -7,7 +7,30 @@ Focuses on conversational critique with minimal structure for UI interaction.
 import re
 from typing import Dict, Optional, List, Any
 from .review_types import ReviewResult, FeedbackItem
-from ...utils.logging_utils import log
+from ...utils.logging_utils import log, log_error, log_warning
+
+# Structured review sections. Each body runs until the next (possibly indented) header,
+# and the recommendation must start on a later line than its header; blank lines between are allowed.
+_CRITIQUE_SECTION = r'## CRITIQUE\s*\n(?P<critique>.*?)(?=\n\s*## |\Z)'
+_FEEDBACK_SECTION = r'## FEEDBACK\s*\n(?P<feedback>.*?)(?=\n\s*## |\Z)'
+_RECOMMENDATION_SECTION = r'## RECOMMENDATION[ \t]*\n\s*(?P<recommendation>KEEP|REGENERATE)'
+_SECTION_FLAGS = re.IGNORECASE | re.DOTALL
+
+_CRITIQUE_RE = re.compile(_CRITIQUE_SECTION, _SECTION_FLAGS)
+_FEEDBACK_RE = re.compile(_FEEDBACK_SECTION, _SECTION_FLAGS)
+_RECOMMENDATION_RE = re.compile(_RECOMMENDATION_SECTION, _SECTION_FLAGS)
+# All three sections in one alternation so a full parse scans the response once
+_SECTIONS_RE = re.compile(
+    '|'.join((_CRITIQUE_SECTION, _FEEDBACK_SECTION, _RECOMMENDATION_SECTION)),
+    _SECTION_FLAGS
+)
+
+# Bullets (•, -, *) or numbered items at the start of a line, capturing following lines
+# until the next item or end. Numbered items keep their "1." prefix in the capture.
+_BULLET_RE = re.compile(
+    r'^\s*(?:[-•*]\s+|(?=\d+\.\s))(.*?)(?=^\s*[-•*]\s|^\s*\d+\.\s|\Z)',
+    re.MULTILINE | re.DOTALL
+)
 
 
 class ReviewResponseParser:
@@ -22,10 +45,11 @@ class ReviewResponseParser:
     """
     
     def __init__(self):
-        # Simple patterns for structured sections
-        self.critique_pattern = re.compile(r'## CRITIQUE\s*\n(.*?)(?=\n## |$)', re.IGNORECASE | re.DOTALL)
-        self.feedback_pattern = re.compile(r'## FEEDBACK\s*\n(.*?)(?=\n## |$)', re.IGNORECASE | re.DOTALL)
-        self.recommendation_pattern = re.compile(r'## RECOMMENDATION\s*\n(KEEP|REGENERATE)', re.IGNORECASE)
+        # Simple patterns for structured sections, compiled once at import
+        self.critique_pattern = _CRITIQUE_RE
+        self.feedback_pattern = _FEEDBACK_RE
+        self.recommendation_pattern = _RECOMMENDATION_RE
+        self.sections_pattern = _SECTIONS_RE
         
     def parse_review_response(
         self,
@@ -55,17 +79,20 @@ class ReviewResponseParser:
                 user_context=user_context
             )
             
+            # Locate all structured sections in a single pass
+            sections = self._scan_sections(llm_response)
+            
             # Extract critique (the main conversational feedback)
-            critique = self._extract_critique(llm_response)
+            critique = self._critique_from_section(sections.get('critique'), llm_response)
             result.critique = critique
             
             # Extract actionable feedback items
-            feedback_items = self._extract_actionable_feedback(llm_response)
+            feedback_items = self._feedback_from_section(sections.get('feedback'))
             for item in feedback_items:
                 result.add_feedback_item(item)
             
             # Determine if email should be regenerated
-            should_regenerate = self._should_regenerate(llm_response)
+            should_regenerate = self._regenerate_from_section(sections.get('recommendation'), llm_response)
             result.should_regenerate = should_regenerate
             
             log(f"Parsed review: {len(feedback_items)} actionable feedback items, "
@@ -74,15 +101,26 @@ class ReviewResponseParser:
             return result
             
         except Exception as e:
-            log(f"Error parsing review response: {str(e)}", prefix="ReviewParser", level="ERROR")
+            log_error(f"Error parsing review response: {str(e)}", prefix="ReviewParser")
             return self._create_fallback_result(email_content, template_info, user_context, llm_response)
 
+    def _scan_sections(self, llm_response: str) -> Dict[str, str]:
+        """Collect the first critique, feedback and recommendation sections in one scan."""
+        sections: Dict[str, str] = {}
+        for match in self.sections_pattern.finditer(llm_response):
+            sections.setdefault(match.lastgroup, match.group(match.lastgroup))
+        return sections
+
     def _extract_critique(self, llm_response: str) -> str:
         """Extract the conversational critique section."""
         critique_match = self.critique_pattern.search(llm_response)
-        if critique_match:
-            critique = critique_match.group(1).strip()
-            return critique
+        section = critique_match.group('critique') if critique_match else None
+        return self._critique_from_section(section, llm_response)
+
+    def _critique_from_section(self, section: Optional[str], llm_response: str) -> str:
+        """Build the critique from its section text, falling back to the raw response."""
+        if section is not None:
+            return section.strip()
         
         # Fallback: take the first substantial paragraph that's not feedback or recommendation
         lines = llm_response.strip().split('\n')
@@ -103,12 +141,16 @@ class ReviewResponseParser:
 
     def _extract_actionable_feedback(self, llm_response: str) -> List[FeedbackItem]:
         """Extract actionable feedback items from the structured response."""
+        feedback_match = self.feedback_pattern.search(llm_response)
+        section = feedback_match.group('feedback') if feedback_match else None
+        return self._feedback_from_section(section)
+
+    def _feedback_from_section(self, section: Optional[str]) -> List[FeedbackItem]:
+        """Build feedback items from the actionable feedback section text."""
         feedback_items = []
         
-        # Extract the actionable feedback section
-        feedback_match = self.feedback_pattern.search(llm_response)
-        if feedback_match:
-            feedback_text = feedback_match.group(1).strip()
+        if section is not None:
+            feedback_text = section.strip()
             items = self._split_feedback_items(feedback_text)
             
             for i, item_text in enumerate(items):
@@ -120,9 +162,7 @@ class ReviewResponseParser:
 
     def _split_feedback_items(self, feedback_text: str) -> List[str]:
         """Split feedback text into individual actionable items, capturing multi-line bullets as a single item."""
-        # Regex to match bullets (•, -, *, or numbered) at the start of a line, capturing following lines until the next bullet or end
-        bullet_regex = re.compile(r'^(?:\s*[-•*]|\s*\d+\.)\s+(.*?)(?=^\s*[-•*]|^\s*\d+\.|\Z)', re.MULTILINE | re.DOTALL)
-        items = [m.strip() for m in bullet_regex.findall(feedback_text)]
+        items = [m.strip() for m in _BULLET_RE.findall(feedback_text)]
         # Filter out empty or too-short items, and section headers
         cleaned_items = [item for item in items if item and len(item) > 10 and not item.startswith('## ')]
         return cleaned_items[:5]  # Limit to 5 items
@@ -136,16 +176,20 @@ class ReviewResponseParser:
             )
             return feedback_item
         except Exception as e:
-            log(f"Error creating feedback item: {str(e)}", prefix="ReviewParser", level="WARNING")
+            log_warning(f"Error creating feedback item: {str(e)}", prefix="ReviewParser")
             return None
 
     def _should_regenerate(self, llm_response: str) -> bool:
         """Determine if email should be regenerated based on recommendation."""
-        # Check explicit recommendation
         recommendation_match = self.recommendation_pattern.search(llm_response)
-        if recommendation_match:
-            recommendation = recommendation_match.group(1).upper()
-            return recommendation == "REGENERATE"
+        recommendation = recommendation_match.group('recommendation') if recommendation_match else None
+        return self._regenerate_from_section(recommendation, llm_response)
+
+    def _regenerate_from_section(self, recommendation: Optional[str], llm_response: str) -> bool:
+        """Decide on regeneration from the recommendation, falling back to keywords."""
+        # Check explicit recommendation
+        if recommendation is not None:
+            return recommendation.upper() == "REGENERATE"
         
         # Fallback: check for regeneration keywords
         response_lower = llm_response.lower()
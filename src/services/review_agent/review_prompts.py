@@ -4,7 +4,8 @@ Review Prompts for Review Agent
 Provides prompt templates and prompt-building functions for the review agent LLM calls.
 Requests conversational critique with structured actionable feedback for UI interaction.
 """
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
+import functools
 import textwrap
 
 REVIEW_PROMPT_TEMPLATE = textwrap.dedent("""
@@ -47,6 +48,9 @@ Format your feedback as a bulleted list:
 {template_context}
 """)
 
+# The email is the only per-call piece, so the template is split around it
+_PROMPT_HEAD, _, _PROMPT_TAIL = REVIEW_PROMPT_TEMPLATE.partition("{email_content}")
+
 def build_review_prompt(
     email_content: str,
     template_info: Optional[Dict] = None,
@@ -70,37 +74,65 @@ def build_review_prompt(
     # Fallbacks for missing info
     industry = recipient_industry or (template_info.get('industry') if template_info else 'the recipient industry')
     
-    # Build template context section
-    template_context = ""
+    # Reduce inputs to the hashable pieces that are actually rendered
     if template_info:
-        template_context += "\n\n## TEMPLATE CONTEXT\n"
+        template_key = (
+            tuple(template_info.get('forbidden_phrases') or ()),
+            tuple(template_info.get('writing_tips') or ()),
+            tuple(template_info.get('preferred_phrases') or ()),
+            str(template_info['structure']) if template_info.get('structure') else None,
+        )
+    else:
+        template_key = None
+    metadata_key = tuple((str(k), str(v)) for k, v in extra_metadata.items()) if extra_metadata else ()
+    
+    head, tail = _build_review_prompt_cached(str(industry), template_key, user_context or None, metadata_key)
+    return head + email_content + tail
+
+
+@functools.lru_cache(maxsize=256)
+def _build_review_prompt_cached(
+    industry: str,
+    template_key: Optional[Tuple[Tuple[str, ...], Tuple[str, ...], Tuple[str, ...], Optional[str]]],
+    user_context: Optional[str],
+    metadata_key: Tuple[Tuple[str, str], ...]
+) -> Tuple[str, str]:
+    """
+    Render everything in the review prompt except the email itself.
+    
+    Returns:
+        The prompt text before and after the email content
+    """
+    # Build template context section
+    parts: List[str] = []
+    if template_key is not None:
+        forbidden_phrases, writing_tips, preferred_phrases, structure = template_key
+        parts.append("\n\n## TEMPLATE CONTEXT\n")
         
-        if 'forbidden_phrases' in template_info and template_info['forbidden_phrases']:
-            template_context += f"**Forbidden phrases to avoid:** {', '.join(template_info['forbidden_phrases'])}\n"
+        if forbidden_phrases:
+            parts.append(f"**Forbidden phrases to avoid:** {', '.join(forbidden_phrases)}\n")
         
-        if 'writing_tips' in template_info and template_info['writing_tips']:
-            template_context += f"**Writing guidelines:** {', '.join(template_info['writing_tips'])}\n"
+        if writing_tips:
+            parts.append(f"**Writing guidelines:** {', '.join(writing_tips)}\n")
         
-        if 'preferred_phrases' in template_info and template_info['preferred_phrases']:
-            template_context += f"**Preferred language:** {', '.join(template_info['preferred_phrases'])}\n"
+        if preferred_phrases:
+            parts.append(f"**Preferred language:** {', '.join(preferred_phrases)}\n")
         
-        if 'structure' in template_info and template_info['structure']:
-            template_context += f"**Template structure:** {template_info['structure']}\n"
+        if structure:
+            parts.append(f"**Template structure:** {structure}\n")
     
     # Add user context if available
     if user_context:
-        template_context += f"\n**User request context:** {user_context}\n"
+        parts.append(f"\n**User request context:** {user_context}\n")
     
     # Add extra metadata if available
-    if extra_metadata:
-        template_context += "\n**Additional context:**\n"
-        for k, v in extra_metadata.items():
-            template_context += f"- {k}: {v}\n"
+    if metadata_key:
+        parts.append("\n**Additional context:**\n")
+        parts.extend(f"- {k}: {v}\n" for k, v in metadata_key)
     
-    prompt = REVIEW_PROMPT_TEMPLATE.format(
-        recipient_industry=industry,
-        email_content=email_content,
-        template_context=template_context
-    )
+    template_context = "".join(parts)
     
-    return prompt 
\ No newline at end of file
+    return (
+        _PROMPT_HEAD.format(recipient_industry=industry),
+        _PROMPT_TAIL.format(template_context=template_context)
+    )
@@ -10,7 +10,7 @@ from typing import List, Dict, Any, Optional
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class FeedbackItem:
     """Represents a single actionable feedback item that can be clicked by the user."""
     
@@ -40,7 +40,7 @@ class FeedbackItem:
         return f"Feedback {self.id}: {self.text}"
 
 
-@dataclass
+@dataclass(slots=True)
 class ReviewResult:
     """Complete review analysis result with minimal structure."""
     
@@ -57,7 +57,10 @@ class ReviewResult:
         self.actionable_feedback.append(feedback)
     
     def get_clickable_feedback(self) -> List[FeedbackItem]:
-        """Get feedback items that can be clicked by the user."""
+        """Get feedback items that can be clicked by the user.
+        
+        Every item is currently clickable, so the underlying list is returned without copying.
+        """
         return self.actionable_feedback
     
     def to_dict(self) -> Dict[str, Any]:
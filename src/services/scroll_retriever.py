@@ -7,6 +7,10 @@ Uses semantic search to find the most appropriate templates for any given situat
 
 import os
 import time
+import hashlib
+import pickle
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Any, Tuple, Optional
 import numpy as np
@@ -16,7 +20,7 @@ import yaml
 import re
 
 from .simple_embeddings import SimpleEmbeddings
-from ..utils.logging_utils import log
+from ..utils.logging_utils import log, WARNING
 from ..utils.file_utils import FileUtils
 from ..utils.error_utils import ErrorHandler
 from .config_service import get_config
@@ -28,7 +32,22 @@ try:
     SENTENCE_TRANSFORMERS_AVAILABLE = True
 except ImportError:
     SENTENCE_TRANSFORMERS_AVAILABLE = False
-    log("WARNING: sentence-transformers not available, using SimpleEmbeddings", prefix="ScrollRetriever")
+    log("WARNING: sentence-transformers not available, using SimpleEmbeddings", prefix="ScrollRetriever", level=WARNING)
+
+try:
+    import hnswlib
+    HNSWLIB_AVAILABLE = True
+except ImportError:
+    HNSWLIB_AVAILABLE = False
+
+# Below this many snippets a brute-force scan beats building an HNSW graph
+HNSW_MIN_SNIPPETS = 1000
+
+# Threads used to read and parse snippet files in load_snippets
+SNIPPET_LOAD_WORKERS = 8
+
+# Bump when the embedding pipeline changes so stale on-disk caches are ignored
+EMBEDDING_CACHE_VERSION = 6
 
 
 @dataclass
@@ -91,7 +110,8 @@ class ScrollRetriever:
                  embedding_model: str = "all-MiniLM-L6-v2",
                  cache_embeddings: bool = True,
                  max_snippets: int = 1000,
-                 use_sentence_transformers: bool = False):
+                 use_sentence_transformers: bool = False,
+                 embedding_cache_dir: Optional[str] = None):
         """
         Initialize the snippet retriever.
         
@@ -101,6 +121,9 @@ class ScrollRetriever:
             cache_embeddings: Whether to cache embeddings in memory
             max_snippets: Maximum number of snippets to load
             use_sentence_transformers: Whether to use sentence-transformers (if available)
+            embedding_cache_dir: Opt-in directory for persisting fitted embeddings across runs,
+                keyed by content hash (default: None, no disk cache). Cached models are
+                unpickled on load, so only point this at a directory you trust
         """
         if snippets_dir is None:
             # Always resolve relative to project root (parent of src)
@@ -112,6 +135,7 @@ class ScrollRetriever:
         self.cache_embeddings = cache_embeddings
         self.max_snippets = max_snippets
         self.use_sentence_transformers = use_sentence_transformers and SENTENCE_TRANSFORMERS_AVAILABLE
+        self.embedding_cache_dir = Path(embedding_cache_dir) if embedding_cache_dir else None
         
         # Initialize components
         self.model = None
@@ -119,6 +143,8 @@ class ScrollRetriever:
         self.vectorizer = None
         self.snippets: List[EmailSnippet] = []
         self.embeddings: Optional[np.ndarray] = None
+        self._normalized_embeddings: Optional[np.ndarray] = None
+        self._hnsw = None
         self._loaded = False
         
         log(f"Initialized ScrollRetriever with {'sentence-transformers' if self.use_sentence_transformers else 'SimpleEmbeddings'}")
@@ -142,40 +168,55 @@ class ScrollRetriever:
         
         def load_all_snippets():
             loaded_count = 0
-            for file_path in yaml_files:
-                if loaded_count >= self.max_snippets:
-                    log(f"Reached max snippets limit ({self.max_snippets})", prefix="ScrollRetriever")
-                    break
-                snippet = self._load_snippet(file_path)
-                if snippet:
-                    self.snippets.append(snippet)
-                    loaded_count += 1
+            next_file = 0
+            # Snippet files are small and I/O-bound, so read and parse them concurrently.
+            # Only submit as many files as are still needed to reach max_snippets, then
+            # top up with the next batch if some of them failed to load; map() yields
+            # results in file order
+            with ThreadPoolExecutor(max_workers=SNIPPET_LOAD_WORKERS) as executor:
+                while loaded_count < self.max_snippets and next_file < len(yaml_files):
+                    batch = yaml_files[next_file:next_file + self.max_snippets - loaded_count]
+                    next_file += len(batch)
+                    for snippet in executor.map(self._load_snippet, batch):
+                        if snippet:
+                            self.snippets.append(snippet)
+                            loaded_count += 1
+            if next_file < len(yaml_files):
+                log(f"Reached max snippets limit ({self.max_snippets})", prefix="ScrollRetriever")
             log(f"Loaded {loaded_count} snippets in {time.time() - start_time:.2f}s", prefix="ScrollRetriever")
             return loaded_count
         
         loaded_count = ErrorHandler.handle_file_operation(load_all_snippets) or 0
         
         if loaded_count > 0:
-            self._generate_embeddings()
+            # Embeddings are generated on the first query, not at load time
             self._loaded = True
         
         return loaded_count
     
+    def _ensure_embeddings(self) -> None:
+        """Generate snippet embeddings if they have not been generated yet."""
+        if self.embeddings is None and self.snippets:
+            self._generate_embeddings()
+    
     def _load_snippet(self, file_path: Path) -> Optional[EmailSnippet]:
         """Load a single YAML template file."""
         def load_single_snippet():
+            parser = YAMLTemplateParser()
+            
             # Parse YAML template
-            yaml_data = YAMLTemplateParser().parse_template(file_path)
+            yaml_data = parser.parse_template(file_path)
             
             # Validate template structure
-            if not YAMLTemplateParser().validate_template(yaml_data):
-                log(f"WARNING: Invalid template structure in {file_path}", prefix="ScrollRetriever")
+            if not parser.validate_template(yaml_data):
+                log(f"WARNING: Invalid template structure in {file_path}", prefix="ScrollRetriever", level=WARNING)
                 return None
             
             # Extract components
-            template_content = YAMLTemplateParser().get_template_content(yaml_data)
-            metadata = YAMLTemplateParser().get_metadata(yaml_data)
-            guidance = YAMLTemplateParser().get_guidance(yaml_data)
+            bundle = parser.extract_all(yaml_data)
+            template_content = bundle.content
+            metadata = bundle.metadata
+            guidance = bundle.guidance
             
             # Process template content for embedding
             processed_content = TextProcessor.preprocess_text(template_content)
@@ -189,7 +230,7 @@ class ScrollRetriever:
             
             # Validate metadata
             if not self._validate_metadata(metadata):
-                log(f"WARNING: Invalid metadata in {file_path}", prefix="ScrollRetriever")
+                log(f"WARNING: Invalid metadata in {file_path}", prefix="ScrollRetriever", level=WARNING)
                 return None
             
             snippet = EmailSnippet(
@@ -217,10 +258,33 @@ class ScrollRetriever:
             log("No snippets to generate embeddings for", prefix="ScrollRetriever")
             return
         
+        self._normalized_embeddings = None
         if self.use_sentence_transformers:
             self._generate_sentence_transformer_embeddings()
         else:
             self._generate_simple_embeddings()
+        
+        self._build_index()
+    
+    def _build_index(self) -> None:
+        """Normalize the snippet embeddings and build an HNSW index for large corpora."""
+        self._hnsw = None
+        if self.embeddings is None:
+            return
+        
+        # Normalize the corpus once here (or reuse the cached copy) so queries skip it
+        if self._normalized_embeddings is None or len(self._normalized_embeddings) != len(self.embeddings):
+            self._normalized_embeddings = SimpleEmbeddings.normalize_rows(
+                np.asarray(self.embeddings, dtype=np.float32)
+            )
+        
+        if HNSWLIB_AVAILABLE and len(self._normalized_embeddings) >= HNSW_MIN_SNIPPETS:
+            # Approximate search only pays off once the corpus is large
+            vectors = np.ascontiguousarray(self._normalized_embeddings, dtype=np.float32)
+            self._hnsw = hnswlib.Index(space='cosine', dim=vectors.shape[1])
+            self._hnsw.init_index(max_elements=len(vectors), ef_construction=200, M=16)
+            self._hnsw.add_items(vectors)
+            log(f"Built HNSW index over {self._hnsw.get_current_count()} snippets", prefix="ScrollRetriever")
     
     def _generate_sentence_transformer_embeddings(self) -> None:
         """Generate embeddings using sentence-transformers."""
@@ -255,7 +319,7 @@ class ScrollRetriever:
         log("Generating embeddings with SimpleEmbeddings", prefix="ScrollRetriever")
         
         # Initialize SimpleEmbeddings
-        self.simple_embeddings = SimpleEmbeddings()
+        model = SimpleEmbeddings()
         
         # Extract matching content for embedding (tags, notes, and template content)
         texts = []
@@ -269,8 +333,17 @@ class ScrollRetriever:
             matching_content = f"{tags}\n\n{notes}\n\n{template_content}".strip()
             texts.append(matching_content)
         
-        # Generate embeddings using fit method
-        self.embeddings = self.simple_embeddings.fit(texts)
+        # With a disk cache configured, reuse a model fitted on identical content
+        cache_key = self._embedding_cache_key(model, texts) if self.embedding_cache_dir else None
+        cached = self._load_cached_embeddings(cache_key) if cache_key else None
+        if cached:
+            self.simple_embeddings, self.embeddings, self._normalized_embeddings = cached
+            log(f"Loaded cached embeddings {cache_key[:12]}", prefix="ScrollRetriever")
+        else:
+            self.simple_embeddings = model
+            self.embeddings = self.simple_embeddings.fit(texts)
+            if cache_key:
+                self._save_cached_embeddings(cache_key)
         
         # Store embeddings with snippets
         for i, snippet in enumerate(self.snippets):
@@ -278,6 +351,72 @@ class ScrollRetriever:
         
         log(f"Generated embeddings for {len(self.snippets)} snippets", prefix="ScrollRetriever")
     
+    def _embedding_cache_key(self, model: SimpleEmbeddings, texts: List[str]) -> str:
+        """Hash the embedded texts, in snippet order, together with the model settings and library versions."""
+        import sklearn
+        
+        # A pickled model is only safe to reuse with the library versions that produced it
+        digest = hashlib.sha256(
+            f"v{EMBEDDING_CACHE_VERSION}:{model.n_components}:{model.max_features}"
+            f":numpy-{np.__version__}:sklearn-{sklearn.__version__}".encode()
+        )
+        for text in texts:
+            digest.update(b"\0")
+            digest.update(text.encode('utf-8'))
+        return digest.hexdigest()
+    
+    def _load_cached_embeddings(
+        self, cache_key: str
+    ) -> Optional[Tuple[SimpleEmbeddings, np.ndarray, np.ndarray]]:
+        """Load a fitted SimpleEmbeddings model and memory-map its raw and normalized embeddings."""
+        model_path = self.embedding_cache_dir / f"{cache_key}.pkl"
+        embeddings_path = self.embedding_cache_dir / f"{cache_key}.npy"
+        normalized_path = self.embedding_cache_dir / f"{cache_key}.normed.npy"
+        if not (model_path.exists() and embeddings_path.exists() and normalized_path.exists()):
+            return None
+        
+        def load_cache():
+            with open(model_path, 'rb') as f:
+                model = pickle.load(f)
+            # Read-only memory maps: pages are loaded on first touch, nothing is copied
+            embeddings = np.load(embeddings_path, mmap_mode='r')
+            normalized = np.load(normalized_path, mmap_mode='r')
+            return model, embeddings, normalized
+        
+        return ErrorHandler.handle_file_operation(load_cache)
+    
+    def _save_cached_embeddings(self, cache_key: str) -> None:
+        """Persist the fitted SimpleEmbeddings model with raw and L2-normalized embeddings."""
+        if not FileUtils.create_directory_if_not_exists(self.embedding_cache_dir):
+            return
+        
+        def save_cache():
+            # Serialize before touching disk, and write the model last, since an
+            # entry only counts once all files exist
+            model_bytes = pickle.dumps(self.simple_embeddings)
+            embeddings = np.asarray(self.embeddings, dtype=np.float32)
+            self._atomic_write(self.embedding_cache_dir / f"{cache_key}.npy",
+                               lambda f: np.save(f, embeddings))
+            self._atomic_write(self.embedding_cache_dir / f"{cache_key}.normed.npy",
+                               lambda f: np.save(f, SimpleEmbeddings.normalize_rows(embeddings)))
+            self._atomic_write(self.embedding_cache_dir / f"{cache_key}.pkl",
+                               lambda f: f.write(model_bytes))
+        
+        ErrorHandler.handle_file_operation(save_cache)
+    
+    @staticmethod
+    def _atomic_write(path: Path, write) -> None:
+        """Write a binary file via a temporary sibling renamed into place, so readers never see a partial file."""
+        fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                write(f)
+            os.replace(temp_path, path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+            raise
+    
     def query(self, 
               query_text: str, 
               top_k: int = 1, 
@@ -296,53 +435,124 @@ class ScrollRetriever:
         Returns:
             List of (snippet, similarity_score) tuples (max 1 result)
         """
+        return self.query_batch([query_text], top_k=top_k, min_similarity=min_similarity, filters=filters)[0]
+    
+    def query_batch(self, 
+                    query_texts: List[str], 
+                    top_k: int = 1, 
+                    min_similarity: float = 0.75,
+                    filters: Optional[Dict[str, Any]] = None) -> List[List[Tuple[EmailSnippet, float]]]:
+        """
+        Query snippets for several texts at once with ErrorHandler.
+        All queries are embedded together and scored in one matrix multiply.
+        
+        Args:
+            query_texts: The query texts
+            top_k: Number of top results to return per query (default 1 for best match)
+            min_similarity: Minimum similarity threshold (default 0.75)
+            filters: Optional filters to apply
+            
+        Returns:
+            One list of (snippet, similarity_score) tuples per query (max 1 result each)
+        """
         if not self._loaded:
             self.load_snippets()
         
-        if not self.snippets:
-            return []
+        if not self.snippets or not query_texts:
+            return [[] for _ in query_texts]
         
         def perform_query():
-            # Get query embedding
-            query_embedding = self._get_query_embedding(query_text)
+            self._ensure_embeddings()
             
-            # Calculate similarities
-            similarities = self._calculate_similarities(query_embedding)
+            # Get query embeddings
+            query_embeddings = self._get_query_embeddings(query_texts)
             
-            # Apply filters and threshold
-            results = []
-            for i, similarity in enumerate(similarities):
-                if similarity >= min_similarity:
-                    snippet = self.snippets[i]
-                    if not filters or self._matches_filters(snippet, filters):
-                        results.append((snippet, similarity))
+            batch_results = []
+            if not filters:
+                # Without filters only the nearest snippets can be returned, best first
+                indices, scores = self._nearest_snippets(query_embeddings, max(top_k, 1))
+                for row_indices, row_scores in zip(indices, scores):
+                    results = [(self.snippets[i], score) for i, score in zip(row_indices, row_scores)
+                               if score >= min_similarity]
+                    batch_results.append(results[:1])  # Only return the best match
+                return batch_results
             
-            # Sort by similarity and return only the best match
-            results.sort(key=lambda x: x[1], reverse=True)
-            return results[:1]  # Only return the best match
-        
-        return ErrorHandler.handle_api_operation(perform_query) or []
+            # Filters may reject the nearest snippets, so they need every score
+            similarity_matrix = self._calculate_similarities(query_embeddings)
+            
+            for similarities in similarity_matrix:
+                # Apply filters and threshold
+                results = []
+                for i, similarity in enumerate(similarities):
+                    if similarity >= min_similarity:
+                        snippet = self.snippets[i]
+                        if not filters or self._matches_filters(snippet, filters):
+                            results.append((snippet, similarity))
+                
+                # Sort by similarity and keep only the best match
+                results.sort(key=lambda x: x[1], reverse=True)
+                batch_results.append(results[:1])  # Only return the best match
+            return batch_results
+        
+        return ErrorHandler.handle_api_operation(perform_query) or [[] for _ in query_texts]
     
-    def _get_query_embedding(self, query_text: str) -> np.ndarray:
-        """Get embedding for query text."""
+    def _get_query_embeddings(self, query_texts: List[str]) -> np.ndarray:
+        """Get embeddings for query texts, one row per query."""
         if self.use_sentence_transformers and self.model:
-            return self.model.encode([query_text])[0]
+            return np.asarray(self.model.encode(query_texts))
         elif self.simple_embeddings:
-            return self.simple_embeddings.transform([query_text])[0]
+            return np.asarray(self.simple_embeddings.transform(query_texts))
         else:
             raise ValueError("No embedding model available")
     
-    def _calculate_similarities(self, query_embedding: np.ndarray) -> np.ndarray:
-        """Calculate similarities between query and all snippets."""
+    def _calculate_similarities(self, query_embeddings: np.ndarray) -> np.ndarray:
+        """
+        Calculate similarities between each query and all snippets.
+        
+        Args:
+            query_embeddings: Matrix of query embeddings, one row per query
+            
+        Returns:
+            Similarity matrix with one row per query and one column per snippet
+        """
         if self.embeddings is None:
-            return np.zeros(len(self.snippets))
+            return np.zeros((len(query_embeddings), len(self.snippets)))
         
-        # Calculate cosine similarities
-        similarities = np.dot(self.embeddings, query_embedding) / (
-            np.linalg.norm(self.embeddings, axis=1) * np.linalg.norm(query_embedding)
-        )
+        # Cosine similarities for every query/snippet pair in one GEMM
+        if self._normalized_embeddings is not None and len(self._normalized_embeddings) == len(self.embeddings):
+            return SimpleEmbeddings.similarity_batch(query_embeddings, self._normalized_embeddings, normalized=True)
+        return SimpleEmbeddings.similarity_batch(query_embeddings, self.embeddings)
+    
+    def _nearest_snippets(self, query_embeddings: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Find the k most similar snippets for each query.
         
-        return similarities
+        Args:
+            query_embeddings: Matrix of query embeddings, one row per query
+            k: Number of nearest snippets wanted per query
+            
+        Returns:
+            Tuple of (snippet indices, similarity scores), one row per query, best first
+        """
+        k = min(k, len(self.snippets))
+        if self._hnsw is not None and self.embeddings is not None and self._hnsw.get_current_count() == len(self.embeddings):
+            # Walk the HNSW graph for just the nearest candidates
+            self._hnsw.set_ef(max(50, k))
+            labels, distances = self._hnsw.knn_query(np.asarray(query_embeddings, dtype=np.float32), k=k)
+            return labels.astype(np.intp), 1.0 - distances
+        
+        similarities = self._calculate_similarities(query_embeddings)
+        if k == 1:
+            # argmax keeps the lowest index on ties, like a stable sort of every score
+            candidates = similarities.argmax(axis=1)[:, np.newaxis]
+        elif k < similarities.shape[1]:
+            # Partition out the k best in linear time, then sort only those
+            candidates = np.argpartition(-similarities, k - 1, axis=1)[:, :k]
+        else:
+            candidates = np.broadcast_to(np.arange(similarities.shape[1]), similarities.shape)
+        scores = np.take_along_axis(similarities, candidates, axis=1)
+        order = np.argsort(-scores, axis=1, kind='stable')
+        return np.take_along_axis(candidates, order, axis=1), np.take_along_axis(scores, order, axis=1)
     
     def _matches_filters(self, snippet: EmailSnippet, filters: Dict[str, Any]) -> bool:
         """Check if snippet matches the given filters."""
@@ -7,11 +7,14 @@ that doesn't require heavy dependencies like PyTorch.
 
 import numpy as np
 from typing import List, Dict, Any
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.decomposition import TruncatedSVD
-from sklearn.metrics.pairwise import cosine_similarity
 from ..utils.text_utils import TextProcessor
 
+# Single precision is plenty for cosine ranking and halves memory traffic
+EMBEDDING_DTYPE = np.float32
+
+# Hash space for TF-IDF terms, wide enough that distinct terms rarely collide
+HASH_FEATURES = 2 ** 18
+
 class SimpleEmbeddings:
     """
     A lightweight embedding service that combines TF-IDF with dimensionality reduction
@@ -29,7 +32,10 @@ class SimpleEmbeddings:
         self.n_components = n_components
         self.max_features = max_features
         self.vectorizer = None
+        self.tfidf = None
         self.svd = None
+        self._feature_columns = None
+        self._index_matrix = None
         self._fitted = False
         
     def fit(self, texts: List[str]) -> np.ndarray:
@@ -42,34 +48,108 @@ class SimpleEmbeddings:
         Returns:
             Embeddings matrix
         """
+        if not texts:
+            raise ValueError("Cannot fit embeddings on an empty list of texts")
+        
+        # sklearn is only needed once a model is fitted; similarity math is pure numpy
+        from sklearn.feature_extraction.text import HashingVectorizer, TfidfTransformer
+        from sklearn.utils.extmath import randomized_svd, svd_flip
+        from scipy.linalg import svd
+        
         # Preprocess texts using TextProcessor
         processed_texts = [TextProcessor.preprocess_text(text) for text in texts]
         
-        # Create TF-IDF vectors
-        self.vectorizer = TfidfVectorizer(
-            max_features=self.max_features,
+        # Count terms by hashing, which skips building a vocabulary
+        self.vectorizer = HashingVectorizer(
+            n_features=HASH_FEATURES,
             stop_words='english',
             ngram_range=(1, 2),
-            min_df=1,
-            max_df=1.0,
-            lowercase=True
+            lowercase=True,
+            alternate_sign=False,
+            norm=None,
+            dtype=EMBEDDING_DTYPE
         )
+        term_counts = self.vectorizer.transform(processed_texts)
+        
+        # Keep the max_features most frequent terms, as TfidfVectorizer would,
+        # so the SVD and its components only span columns the corpus uses
+        term_totals = np.asarray(term_counts.sum(axis=0)).ravel()
+        used_columns = np.flatnonzero(term_totals)
+        if not len(used_columns):
+            raise ValueError("Empty vocabulary; the texts may only contain stop words")
+        most_frequent = np.argsort(-term_totals[used_columns], kind='stable')[:self.max_features]
+        self._feature_columns = np.sort(used_columns[most_frequent])
+        
+        # Create sparse TF-IDF vectors over the kept terms
+        self.tfidf = TfidfTransformer()
+        tfidf_matrix = self.tfidf.fit_transform(term_counts[:, self._feature_columns])
         
-        tfidf_matrix = self.vectorizer.fit_transform(processed_texts)
-        n_features = tfidf_matrix.shape[1]
-        n_components = min(self.n_components, n_features) if n_features > 0 else 1
+        # Embeddings keep TruncatedSVD's width of min(n_components, n_features),
+        # but a corpus of m documents has at most m non-zero components
+        n_components = min(self.n_components, tfidf_matrix.shape[1])
+        rank = min(n_components, tfidf_matrix.shape[0])
         
-        # Reduce dimensionality using SVD for semantic compression
-        self.svd = TruncatedSVD(n_components=n_components, random_state=42)
-        embeddings = self.svd.fit_transform(tfidf_matrix)
+        # Reduce dimensionality using SVD for semantic compression. The SVD cost
+        # scales with min(m, n)^2 * max(m, n), so factor the tall-and-thin side
+        transposed = tfidf_matrix.shape[1] > tfidf_matrix.shape[0]
+        svd_input = tfidf_matrix.T if transposed else tfidf_matrix
+        if rank < min(svd_input.shape):
+            u, sigma, vt = randomized_svd(svd_input, n_components=rank, random_state=42)
+        else:
+            # Every component is kept, so an exact SVD is cheaper than sampling.
+            # Only densify here, where one side of the matrix is at most n_components
+            u, sigma, vt = svd(svd_input.toarray(), full_matrices=False, lapack_driver='gesdd')
+            u, vt = svd_flip(u, vt)
+        if transposed:
+            u, vt = vt.T, u.T
+        
+        embeddings = u * sigma
+        self.svd = self._fitted_svd(tfidf_matrix, embeddings, sigma, vt, n_components)
         
         self._fitted = True
-        return embeddings
+        return np.pad(embeddings, ((0, 0), (0, n_components - rank)))
+    
+    @staticmethod
+    def _fitted_svd(tfidf_matrix, embeddings: np.ndarray, sigma: np.ndarray,
+                    vt: np.ndarray, n_components: int):
+        """
+        Wrap a precomputed factorization in a fitted TruncatedSVD.
+        
+        Components beyond the rank of the corpus are zero, as TruncatedSVD would
+        leave them up to sampling noise.
+        
+        Args:
+            tfidf_matrix: TF-IDF matrix that was factored
+            embeddings: Projection of tfidf_matrix onto the components
+            sigma: Singular values
+            vt: Components, one per row
+            n_components: Number of components to pad to
+            
+        Returns:
+            TruncatedSVD whose transform projects onto vt
+        """
+        from sklearn.decomposition import TruncatedSVD
+        from sklearn.utils.sparsefuncs import mean_variance_axis
+        
+        padding = n_components - len(sigma)
+        explained_variance = np.pad(np.var(embeddings, axis=0), (0, padding))
+        total_variance = mean_variance_axis(tfidf_matrix, axis=0)[1].sum()
+        
+        svd = TruncatedSVD(n_components=n_components, random_state=42)
+        svd.components_ = np.pad(vt, ((0, padding), (0, 0)))
+        svd.singular_values_ = np.pad(sigma, (0, padding))
+        svd.explained_variance_ = explained_variance
+        svd.explained_variance_ratio_ = explained_variance / total_variance if total_variance else explained_variance
+        svd.n_features_in_ = tfidf_matrix.shape[1]
+        return svd
     
     def transform(self, texts: List[str]) -> np.ndarray:
         """
         Transform texts to embeddings using the fitted model.
         
+        The whole list is hashed, weighted and projected in one pass, so embed
+        texts together rather than calling this once per text.
+        
         Args:
             texts: List of text strings to transform
             
@@ -80,7 +160,8 @@ class SimpleEmbeddings:
             raise ValueError("Model must be fitted before transforming")
         
         processed_texts = [TextProcessor.preprocess_text(text) for text in texts]
-        tfidf_matrix = self.vectorizer.transform(processed_texts)
+        term_counts = self.vectorizer.transform(processed_texts)
+        tfidf_matrix = self.tfidf.transform(term_counts[:, self._feature_columns])
         embeddings = self.svd.transform(tfidf_matrix)
         
         return embeddings
@@ -96,7 +177,68 @@ class SimpleEmbeddings:
         Returns:
             Array of similarity scores
         """
-        return cosine_similarity([query_embedding], embeddings)[0]
+        matrix = self.normalize_rows(np.asarray(embeddings, dtype=EMBEDDING_DTYPE))
+        return matrix @ self._normalize_query(query_embedding)
+    
+    @staticmethod
+    def similarity_batch(query_embeddings: np.ndarray, embeddings: np.ndarray, normalized: bool = False) -> np.ndarray:
+        """
+        Calculate cosine similarity between every query and every embedding.
+        
+        Args:
+            query_embeddings: Matrix of query embeddings, one row per query
+            embeddings: Matrix of embeddings to compare against
+            normalized: Whether the embeddings rows are already unit length
+            
+        Returns:
+            Matrix of similarity scores with one row per query
+        """
+        queries = SimpleEmbeddings.normalize_rows(np.asarray(query_embeddings, dtype=EMBEDDING_DTYPE))
+        matrix = np.asarray(embeddings, dtype=EMBEDDING_DTYPE)
+        if not normalized:
+            matrix = SimpleEmbeddings.normalize_rows(matrix)
+        return queries @ matrix.T
+    
+    def prepare_index(self, embeddings: np.ndarray) -> None:
+        """
+        Normalize an embeddings matrix once for repeated similarity queries.
+        
+        Args:
+            embeddings: Matrix of embeddings to compare queries against
+        """
+        self._index_matrix = self.normalize_rows(np.asarray(embeddings, dtype=EMBEDDING_DTYPE))
+    
+    def similarity_indexed(self, query_embedding: np.ndarray) -> np.ndarray:
+        """
+        Calculate cosine similarity between a query and the prepared index.
+        
+        Args:
+            query_embedding: Query embedding vector
+            
+        Returns:
+            Array of similarity scores, one per indexed row
+        """
+        if self._index_matrix is None:
+            raise ValueError("Index must be prepared before querying")
+        
+        # One matrix-vector product scores every row at once
+        return self._index_matrix @ self._normalize_query(query_embedding)
+    
+    @staticmethod
+    def _normalize_query(query_embedding: np.ndarray) -> np.ndarray:
+        """Scale a vector to unit length, leaving a zero vector at zero instead of NaN."""
+        query = np.asarray(query_embedding, dtype=EMBEDDING_DTYPE)
+        query_norm = np.sqrt(query @ query)
+        return query / (query_norm if query_norm else 1.0)
+    
+    @staticmethod
+    def normalize_rows(matrix: np.ndarray) -> np.ndarray:
+        """Scale each row to unit length, leaving zero rows at zero instead of NaN."""
+        # Squared row norms in one pass, then a single scaling pass
+        squared_norms = np.einsum('ij,ij->i', matrix, matrix)
+        inverse_norms = np.zeros_like(squared_norms)
+        np.divide(1.0, np.sqrt(squared_norms), out=inverse_norms, where=squared_norms > 0)
+        return matrix * inverse_norms[:, np.newaxis]
 
 def create_embeddings(texts: List[str], n_components: int = 128) -> tuple:
     """
@@ -0,0 +1,40 @@
+"""
+Shared fixtures for service tests.
+"""
+import textwrap
+import pytest
+from unittest.mock import Mock
+from src.services.llm_service import LLMService
+
+
+SAMPLE_LLM_RESPONSE = textwrap.dedent("""
+    ## CRITIQUE
+    This email has a good basic structure and professional tone. The opening is appropriate and the message is clear. However, it lacks specific details about the collaboration opportunity and could benefit from more personalization.
+
+    ## FEEDBACK
+     - Add specific details about the collaboration opportunity
+     - Include more personalization based on the recipient's background
+     - Consider adding a clear call-to-action
+
+    ## RECOMMENDATION
+    KEEP
+""").strip()
+
+
+@pytest.fixture
+def mock_llm_service():
+    """Create a fresh mock LLM service for each test, specced so only the real LLMService interface works."""
+    return Mock(spec=LLMService)
+
+
+@pytest.fixture(scope="session")
+def sample_llm_response():
+    """Sample structured LLM review response for testing."""
+    return SAMPLE_LLM_RESPONSE
+
+
+@pytest.fixture(scope="session")
+def tech_template_info():
+    """Minimal template metadata shared by review tests. Do not mutate."""
+    return {"industry": "tech"}
+
@@ -0,0 +1,81 @@
+"""
+Tests for SimpleEmbeddings construction and similarity math.
+
+These only build numpy arrays, so they never import sklearn.
+"""
+
+import pytest
+import numpy as np
+
+from src.services.simple_embeddings import SimpleEmbeddings
+
+
+class TestSimpleEmbeddingsNumeric:
+    """Test cases for SimpleEmbeddings that need no fitted model."""
+    
+    def test_initialization(self):
+        """Test SimpleEmbeddings initialization."""
+        embeddings = SimpleEmbeddings()
+        assert embeddings.n_components == 128
+        assert embeddings.max_features == 2000
+        assert embeddings.vectorizer is None
+        assert embeddings.svd is None
+        assert embeddings._fitted is False
+    
+    def test_initialization_custom_params(self):
+        """Test SimpleEmbeddings initialization with custom parameters."""
+        embeddings = SimpleEmbeddings(n_components=64, max_features=1000)
+        assert embeddings.n_components == 64
+        assert embeddings.max_features == 1000
+    
+    def test_transform_without_fit(self):
+        """Test transform without fitting first."""
+        embeddings = SimpleEmbeddings()
+        texts = ["Test text"]
+        
+        with pytest.raises(ValueError, match="Model must be fitted before transforming"):
+            embeddings.transform(texts)
+    
+    def test_similarity(self):
+        """Test similarity calculation."""
+        embeddings = SimpleEmbeddings()
+        
+        # Create test embeddings
+        query_embedding = np.array([0.1, 0.2, 0.3])
+        embeddings_matrix = np.array([
+            [0.1, 0.2, 0.3],  # Same as query
+            [0.9, 0.8, 0.7],  # Different from query
+            [0.2, 0.4, 0.6]   # Somewhat similar
+        ])
+        
+        similarities = embeddings.similarity(query_embedding, embeddings_matrix)
+        
+        assert len(similarities) == 3
+        assert similarities[0] > 0.99  # Should be very similar to itself
+        # Note: cosine similarity can be higher than expected with normalized vectors
+        assert similarities[1] < 0.95   # Should be less similar
+        assert similarities[2] > 0.5   # Should be somewhat similar
+    
+    def test_similarity_edge_cases(self):
+        """Test similarity calculation with edge cases."""
+        embeddings = SimpleEmbeddings()
+        
+        # Test with zero vectors
+        query_embedding = np.array([0.0, 0.0, 0.0])
+        embeddings_matrix = np.array([
+            [0.0, 0.0, 0.0],
+            [1.0, 0.0, 0.0]
+        ])
+        
+        similarities = embeddings.similarity(query_embedding, embeddings_matrix)
+        assert len(similarities) == 2
+        # Zero vectors may not always have similarity 1.0 due to normalization
+        assert similarities[0] >= 0.0
+        assert similarities[1] >= 0.0
+    
+    def test_similarity_indexed_without_index(self):
+        """Test querying before an index has been prepared."""
+        embeddings = SimpleEmbeddings()
+        
+        with pytest.raises(ValueError, match="Index must be prepared before querying"):
+            embeddings.similarity_indexed(np.array([0.1, 0.2, 0.3]))
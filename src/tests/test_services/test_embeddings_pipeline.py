@@ -1,11 +1,13 @@
 """
-Tests for SimpleEmbeddings service.
+Tests for the SimpleEmbeddings fit/transform pipeline.
+
+Similarity math that needs no fitted model lives in test_embeddings_numeric.py.
 """
 
 import pytest
 import numpy as np
 from unittest.mock import patch, MagicMock
-from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.decomposition import TruncatedSVD
 
 from src.services.simple_embeddings import SimpleEmbeddings, create_embeddings
 from src.utils.text_utils import TextProcessor
@@ -14,21 +16,6 @@ from src.utils.text_utils import TextProcessor
 class TestSimpleEmbeddings:
     """Test cases for SimpleEmbeddings class."""
     
-    def test_initialization(self):
-        """Test SimpleEmbeddings initialization."""
-        embeddings = SimpleEmbeddings()
-        assert embeddings.n_components == 128
-        assert embeddings.max_features == 2000
-        assert embeddings.vectorizer is None
-        assert embeddings.svd is None
-        assert embeddings._fitted is False
-    
-    def test_initialization_custom_params(self):
-        """Test SimpleEmbeddings initialization with custom parameters."""
-        embeddings = SimpleEmbeddings(n_components=64, max_features=1000)
-        assert embeddings.n_components == 64
-        assert embeddings.max_features == 1000
-    
     def test_preprocess_text(self):
         """Test text preprocessing."""
         # Test basic preprocessing
@@ -73,14 +60,6 @@ class TestSimpleEmbeddings:
         with pytest.raises(ValueError):
             embeddings.fit(texts)
     
-    def test_transform_without_fit(self):
-        """Test transform without fitting first."""
-        embeddings = SimpleEmbeddings()
-        texts = ["Test text"]
-        
-        with pytest.raises(ValueError, match="Model must be fitted before transforming"):
-            embeddings.transform(texts)
-    
     def test_transform(self):
         """Test transforming texts to embeddings."""
         embeddings = SimpleEmbeddings(n_components=2, max_features=10)
@@ -97,43 +76,6 @@ class TestSimpleEmbeddings:
         assert result.shape[1] <= 2  # components limited by n_components
         assert isinstance(result, np.ndarray)
     
-    def test_similarity(self):
-        """Test similarity calculation."""
-        embeddings = SimpleEmbeddings()
-        
-        # Create test embeddings
-        query_embedding = np.array([0.1, 0.2, 0.3])
-        embeddings_matrix = np.array([
-            [0.1, 0.2, 0.3],  # Same as query
-            [0.9, 0.8, 0.7],  # Different from query
-            [0.2, 0.4, 0.6]   # Somewhat similar
-        ])
-        
-        similarities = embeddings.similarity(query_embedding, embeddings_matrix)
-        
-        assert len(similarities) == 3
-        assert similarities[0] > 0.99  # Should be very similar to itself
-        # Note: cosine similarity can be higher than expected with normalized vectors
-        assert similarities[1] < 0.95   # Should be less similar
-        assert similarities[2] > 0.5   # Should be somewhat similar
-    
-    def test_similarity_edge_cases(self):
-        """Test similarity calculation with edge cases."""
-        embeddings = SimpleEmbeddings()
-        
-        # Test with zero vectors
-        query_embedding = np.array([0.0, 0.0, 0.0])
-        embeddings_matrix = np.array([
-            [0.0, 0.0, 0.0],
-            [1.0, 0.0, 0.0]
-        ])
-        
-        similarities = embeddings.similarity(query_embedding, embeddings_matrix)
-        assert len(similarities) == 2
-        # Zero vectors may not always have similarity 1.0 due to normalization
-        assert similarities[0] >= 0.0
-        assert similarities[1] >= 0.0
-    
     def test_fit_transform_consistency(self):
         """Test that fit and transform produce consistent results."""
         embeddings = SimpleEmbeddings(n_components=4, max_features=10)
@@ -148,6 +90,29 @@ class TestSimpleEmbeddings:
         # Results should be identical
         np.testing.assert_array_almost_equal(fit_embeddings, transform_embeddings)
     
+    def test_exact_svd_keeps_every_component(self):
+        """Test that a fit keeping every component reproduces the TF-IDF matrix."""
+        embeddings = SimpleEmbeddings(n_components=4, max_features=10)
+        texts = ["Hello world", "Goodbye world", "Test document"]
+        
+        fit_embeddings = embeddings.fit(texts)
+        term_counts = embeddings.vectorizer.transform(texts)[:, embeddings._feature_columns]
+        tfidf_matrix = embeddings.tfidf.transform(term_counts).toarray()
+        
+        np.testing.assert_array_almost_equal(fit_embeddings @ embeddings.svd.components_, tfidf_matrix, decimal=5)
+    
+    def test_embeddings_padded_to_n_components(self):
+        """Test that a corpus smaller than n_components still yields n_components columns."""
+        embeddings = SimpleEmbeddings(n_components=4, max_features=10)
+        texts = ["Hello world", "Goodbye world", "Test document"]
+        
+        fit_embeddings = embeddings.fit(texts)
+        
+        assert isinstance(embeddings.svd, TruncatedSVD)
+        assert fit_embeddings.shape == (3, 4)
+        assert embeddings.transform(["Hello"]).shape == (1, 4)
+        np.testing.assert_array_equal(fit_embeddings[:, 3], 0)
+    
     def test_different_texts_embeddings(self):
         """Test that different texts produce different embeddings."""
         embeddings = SimpleEmbeddings(n_components=4, max_features=10)
@@ -155,14 +120,12 @@ class TestSimpleEmbeddings:
         
         embeddings.fit(texts)
         
-        # Get embeddings for each text
-        embeddings_list = embeddings.transform(texts)
+        # Get embeddings for all texts in one batch
+        embeddings_matrix = embeddings.transform(texts)
         
-        # All embeddings should be different
-        for i in range(len(texts)):
-            for j in range(i + 1, len(texts)):
-                similarity = embeddings.similarity(embeddings_list[i], [embeddings_list[j]])[0]
-                assert similarity < 1.0  # Should not be identical
+        # All embeddings should be different: no off-diagonal pair is identical
+        similarity_matrix = embeddings.similarity_batch(embeddings_matrix, embeddings_matrix)
+        assert np.all(similarity_matrix[np.triu_indices(len(texts), k=1)] < 1.0)
 
 
 class TestCreateEmbeddings:
@@ -226,15 +189,22 @@ class TestSimpleEmbeddingsIntegration:
         # Transform queries
         query_embeddings = embeddings.transform(query_texts)
         
-        # Calculate similarities
-        for i, query_embedding in enumerate(query_embeddings):
-            similarities = embeddings.similarity(query_embedding, train_embeddings)
-            
-            # All similarities should be between -1 and 1 (cosine similarity range)
-            assert all(-1 <= sim <= 1 for sim in similarities)
-            
-            # Should have some similarity to at least one training text
-            assert max(similarities) > -1
+        # Score every query against the training set in one batch
+        similarity_matrix = embeddings.similarity_batch(query_embeddings, train_embeddings)
+        assert similarity_matrix.shape == (len(query_texts), len(train_texts))
+        
+        # The prepared index gives the same scores one query at a time
+        embeddings.prepare_index(train_embeddings)
+        for query_embedding, similarities in zip(query_embeddings, similarity_matrix):
+            np.testing.assert_array_almost_equal(
+                similarities, embeddings.similarity_indexed(query_embedding)
+            )
+        
+        # All similarities should be between -1 and 1 (cosine similarity range)
+        assert np.all((similarity_matrix >= -1) & (similarity_matrix <= 1))
+        
+        # Each query should have some similarity to at least one training text
+        assert np.all(similarity_matrix.max(axis=1) > -1)
     
     def test_embedding_quality(self):
         """Test that embeddings capture semantic similarity."""
@@ -258,16 +228,47 @@ class TestSimpleEmbeddingsIntegration:
         follow_up_idx = 3
         cooking_idx = 4
         
-        # Email-related texts should be more similar to each other
-        email_similarity = embeddings.similarity(
-            embeddings_matrix[email_marketing_idx], 
-            [embeddings_matrix[email_outreach_idx]]
-        )[0]
+        # Score every pair of texts in one GEMM
+        similarity_matrix = embeddings.similarity_batch(embeddings_matrix, embeddings_matrix)
         
-        cooking_similarity = embeddings.similarity(
-            embeddings_matrix[email_marketing_idx], 
-            [embeddings_matrix[cooking_idx]]
-        )[0]
+        # Email-related texts should be more similar to each other
+        email_similarity = similarity_matrix[email_marketing_idx, email_outreach_idx]
+        cooking_similarity = similarity_matrix[email_marketing_idx, cooking_idx]
         
         # Email-related texts should be more similar than email vs cooking
-        assert email_similarity > cooking_similarity 
\ No newline at end of file
+        assert email_similarity > cooking_similarity
+    
+    @pytest.mark.io
+    def test_ranking_matches_tfidf_vectorizer_on_scrolls(self):
+        """Test that hashed terms rank the bundled scrolls like the vocabulary-based TfidfVectorizer."""
+        from sklearn.feature_extraction.text import TfidfVectorizer
+        from src.services.scroll_retriever import ScrollRetriever
+        
+        retriever = ScrollRetriever()
+        assert retriever.load_snippets() > 0
+        texts = [snippet.template_content for snippet in retriever.snippets]
+        queries = texts + [
+            "Booking a DJ set at your venue",
+            "Following up after the conference",
+            "SaaS demo for a medical practice",
+            "Invitation to our webinar",
+        ]
+        
+        # Reference pipeline: vocabulary-based TF-IDF followed by TruncatedSVD
+        processed_texts = [TextProcessor.preprocess_text(text) for text in texts]
+        processed_queries = [TextProcessor.preprocess_text(query) for query in queries]
+        vectorizer = TfidfVectorizer(max_features=2000, stop_words='english', ngram_range=(1, 2))
+        tfidf_matrix = vectorizer.fit_transform(processed_texts)
+        svd = TruncatedSVD(n_components=min(128, tfidf_matrix.shape[1]), random_state=42)
+        reference_matrix = svd.fit_transform(tfidf_matrix)
+        reference = SimpleEmbeddings.similarity_batch(
+            svd.transform(vectorizer.transform(processed_queries)), reference_matrix
+        )
+        
+        embeddings = SimpleEmbeddings()
+        embeddings_matrix = embeddings.fit(texts)
+        scores = embeddings.similarity_batch(embeddings.transform(queries), embeddings_matrix)
+        
+        # Scores only drift by the odd hash collision, so every query picks the same snippet
+        np.testing.assert_allclose(scores, reference, atol=0.01)
+        np.testing.assert_array_equal(scores.argmax(axis=1), reference.argmax(axis=1))
@@ -4,7 +4,6 @@ Comprehensive tests for the Review Agent
 Tests all components: review_types, review_prompts, review_parser, and review_agent.
 """
 import pytest
-from unittest.mock import Mock, patch
 from datetime import datetime
 from src.services.review_agent.review_types import (
     FeedbackItem, 
@@ -14,9 +13,52 @@ from src.services.review_agent.review_types import (
 from src.services.review_agent.review_prompts import build_review_prompt
 from src.services.review_agent.review_parser import ReviewResponseParser
 from src.services.review_agent.review_agent import ReviewAgent
-from src.services.llm_service import LLMService
+from src.services.review_agent import review_types
+
+# Fixed timestamp so serialization tests are deterministic
+_TS = "2024-01-01T00:00:00"
+
+# Substrings the fully-parameterized review prompt must contain
+_REQUIRED_PROMPT_SUBSTRINGS = (
+    "healthcare",
+    "synergy",
+    "leverage",
+    "collaboration",
+    "partnership",
+    "Healthcare outreach",
+    "urgency: high",
+)
+
+
+class _FrozenDatetime(datetime):
+    """datetime subclass whose now() always returns the fixed test timestamp."""
+
+    @classmethod
+    def now(cls, tz=None):
+        return cls.fromisoformat(_TS)
+
+
+class _StubParser:
+    """Minimal stand-in for ReviewResponseParser that returns a preset result."""
+
+    def __init__(self):
+        self.result = None
+        self.calls = 0
+
+    def parse_review_response(self, **kwargs):
+        self.calls += 1
+        return self.result
+
+
+@pytest.fixture(autouse=True, scope="module")
+def _freeze_time():
+    """Freeze datetime.now() inside review_types for the whole module."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(review_types, "datetime", _FrozenDatetime)
+        yield
 
 
+@pytest.mark.xdist_group(name="test_review_agent::TestReviewTypes")
 class TestReviewTypes:
     """Test cases for review_types module."""
     
@@ -46,7 +88,7 @@ class TestReviewTypes:
 
     def test_feedback_item_from_dict(self):
         """Test FeedbackItem deserialization from dictionary."""
-        timestamp = datetime.now().isoformat()
+        timestamp = _TS
         data = {
             "id": "test_1",
             "text": "Test feedback text",
@@ -148,7 +190,7 @@ class TestReviewTypes:
 
     def test_review_result_from_dict(self):
         """Test ReviewResult deserialization from dictionary."""
-        timestamp = datetime.now().isoformat()
+        timestamp = _TS
         data = {
             "email_content": "Test email",
             "critique": "Test critique",
@@ -209,6 +251,7 @@ class TestReviewTypes:
         assert feedback.text == "Test feedback text"
 
 
+@pytest.mark.xdist_group(name="test_review_agent::TestReviewPrompts")
 class TestReviewPrompts:
     """Test cases for review_prompts module."""
     
@@ -314,6 +357,7 @@ class TestReviewPrompts:
         assert "urgency: high" in prompt
 
 
+@pytest.mark.xdist_group(name="test_review_agent::TestReviewParser")
 class TestReviewParser:
     """Test cases for review_parser module."""
     
@@ -322,21 +366,6 @@ class TestReviewParser:
         """Create a ReviewResponseParser instance."""
         return ReviewResponseParser()
     
-    @pytest.fixture
-    def sample_llm_response(self):
-        """Sample LLM response for testing."""
-        return """
-        ## CRITIQUE
-        This email has a good basic structure and professional tone. The opening is appropriate and the message is clear. However, it lacks specific details about the collaboration opportunity and could benefit from more personalization.
-        
-        ## FEEDBACK
-         - Add specific details about the collaboration opportunity
-         - Include more personalization based on the recipient's background
-         - Consider adding a clear call-to-action
-        
-        ## RECOMMENDATION
-        KEEP
-        """
     
     def test_parser_initialization(self, parser):
         """Test parser initialization."""
@@ -372,7 +401,7 @@ class TestReviewParser:
         assert len(feedback_items) == 3
         assert feedback_items[0].text == "Add specific details about the collaboration opportunity"
         assert feedback_items[1].text == "Include more personalization based on the recipient's background"
-        assert feedback_items[2].text == "Consider adding a clear call"
+        assert feedback_items[2].text == "Consider adding a clear call-to-action"
 
     def test_extract_actionable_feedback_no_section(self, parser):
         """Test feedback extraction when section not found."""
@@ -546,21 +575,16 @@ class TestReviewParser:
         assert result.should_regenerate == False
 
 
+@pytest.mark.xdist_group(name="test_review_agent::TestReviewAgent")
 class TestReviewAgent:
     """Test cases for review_agent module."""
     
-    @pytest.fixture
-    def mock_llm_service(self):
-        """Create a mock LLM service."""
-        mock_service = Mock(spec=LLMService)
-        return mock_service
-    
     @pytest.fixture
     def review_agent(self, mock_llm_service):
         """Create a ReviewAgent instance with mock dependencies."""
         agent = ReviewAgent(mock_llm_service)
-        # Mock the parser
-        agent.parser = Mock()
+        # Stub the parser
+        agent.parser = _StubParser()
         return agent
     
     @pytest.fixture
@@ -574,22 +598,6 @@ class TestReviewAgent:
         Best regards,
         John
         """
-    
-    @pytest.fixture
-    def sample_llm_response(self):
-        """Sample structured LLM response for testing."""
-        return """
-        ## CRITIQUE
-        This email has a good basic structure and professional tone. The opening is appropriate and the message is clear. However, it lacks specific details about the collaboration opportunity and could benefit from more personalization.
-        
-        ## FEEDBACK
-         - Add specific details about the collaboration opportunity
-         - Include more personalization based on the recipient's background
-         - Consider adding a clear call-to-action
-        
-        ## RECOMMENDATION
-        KEEP
-        """
 
     def test_review_agent_initialization(self, review_agent):
         """Test that ReviewAgent initializes correctly."""
@@ -602,7 +610,6 @@ class TestReviewAgent:
         review_agent.llm_service.generate_response.return_value = sample_llm_response
         
         # Mock parser response
-        from src.services.review_agent.review_types import ReviewResult, FeedbackItem
         mock_result = ReviewResult(
             email_content=sample_email_content,
             critique="This email has a good basic structure...",
@@ -613,7 +620,7 @@ class TestReviewAgent:
             text="Add specific details about the collaboration opportunity"
         )
         mock_result.add_feedback_item(feedback_item)
-        review_agent.parser.parse_review_response.return_value = mock_result
+        review_agent.parser.result = mock_result
         
         # Call the method
         result = review_agent.review_email(
@@ -626,7 +633,7 @@ class TestReviewAgent:
         review_agent.llm_service.generate_response.assert_called_once()
         
         # Verify parser was called
-        review_agent.parser.parse_review_response.assert_called_once()
+        assert review_agent.parser.calls == 1
         
         # Verify result
         assert result.critique == "This email has a good basic structure..."
@@ -661,8 +668,6 @@ class TestReviewAgent:
 
     def test_get_critique(self, review_agent):
         """Test getting critique from review result."""
-        from src.services.review_agent.review_types import ReviewResult
-        
         mock_result = ReviewResult(
             email_content="test",
             critique="This is a detailed critique of the email."
@@ -673,8 +678,6 @@ class TestReviewAgent:
 
     def test_get_critique_empty(self, review_agent):
         """Test getting critique when empty."""
-        from src.services.review_agent.review_types import ReviewResult
-        
         mock_result = ReviewResult(
             email_content="test",
             critique=""
@@ -685,8 +688,6 @@ class TestReviewAgent:
 
     def test_get_actionable_feedback(self, review_agent):
         """Test getting actionable feedback items."""
-        from src.services.review_agent.review_types import ReviewResult, FeedbackItem
-        
         # Create mock feedback items
         feedback_item = FeedbackItem(
             id="test_1",
@@ -705,8 +706,6 @@ class TestReviewAgent:
 
     def test_should_regenerate_email(self, review_agent):
         """Test regeneration recommendation."""
-        from src.services.review_agent.review_types import ReviewResult
-        
         mock_result = ReviewResult(
             email_content="test",
             critique="Test critique",
@@ -718,8 +717,6 @@ class TestReviewAgent:
 
     def test_get_review_display_data(self, review_agent):
         """Test getting formatted display data for UI."""
-        from src.services.review_agent.review_types import ReviewResult, FeedbackItem
-        
         # Create mock feedback items
         feedback_item = FeedbackItem(
             id="test_1",
@@ -748,13 +745,12 @@ class TestReviewAgent:
         review_agent.llm_service.generate_response.return_value = sample_llm_response
         
         # Mock parser response
-        from src.services.review_agent.review_types import ReviewResult
         mock_result = ReviewResult(
             email_content=sample_email_content,
             critique="Good email with template adherence.",
             should_regenerate=False
         )
-        review_agent.parser.parse_review_response.return_value = mock_result
+        review_agent.parser.result = mock_result
         
         template_info = {
             "industry": "healthcare",
@@ -777,13 +773,8 @@ class TestReviewAgent:
         call_args = review_agent.llm_service.generate_response.call_args
         prompt = call_args[1]['prompt']  # prompt is the first positional argument
         
-        assert "healthcare" in prompt
-        assert "synergy" in prompt
-        assert "leverage" in prompt
-        assert "collaboration" in prompt
-        assert "partnership" in prompt
-        assert "Healthcare outreach" in prompt
-        assert "urgency: high" in prompt
+        missing = [s for s in _REQUIRED_PROMPT_SUBSTRINGS if s not in prompt]
+        assert not missing, f"missing: {missing}"
         
         # Verify temperature and max_tokens were passed
         assert call_args[1]['temperature'] == 0.2
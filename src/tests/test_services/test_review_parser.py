@@ -1,35 +1,41 @@
 """
 Tests for review_parser module.
 """
+import textwrap
 import pytest
 from src.services.review_agent.review_parser import ReviewResponseParser
 from src.services.review_agent.review_types import FeedbackItem
 
 
+SAMPLE_LLM_RESPONSE = textwrap.dedent("""
+    ## CRITIQUE
+    This email has a good basic structure and professional tone. The opening is appropriate and the message is clear. However, it lacks specific details about the collaboration opportunity and could benefit from more personalization.
+
+    ## FEEDBACK
+     - Add specific details about the collaboration opportunity
+     - Include more personalization based on the recipient's background
+     - Consider adding a clear call-to-action
+     - Make the subject line more compelling
+
+    ## RECOMMENDATION
+    KEEP
+""").strip()
+
+
+@pytest.fixture(scope="session")
+def parser():
+    """Create a ReviewResponseParser instance; parsing never mutates it."""
+    return ReviewResponseParser()
+
+
+@pytest.mark.xdist_group(name="test_review_parser::TestReviewParser")
 class TestReviewParser:
     """Test cases for review_parser module."""
     
-    @pytest.fixture
-    def parser(self):
-        """Create a ReviewResponseParser instance."""
-        return ReviewResponseParser()
-    
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_llm_response(self):
         """Sample LLM response for testing."""
-        return """
-        ## CRITIQUE
-        This email has a good basic structure and professional tone. The opening is appropriate and the message is clear. However, it lacks specific details about the collaboration opportunity and could benefit from more personalization.
-        
-        ## FEEDBACK
-         - Add specific details about the collaboration opportunity
-         - Include more personalization based on the recipient's background
-         - Consider adding a clear call-to-action
-         - Make the subject line more compelling
-        
-        ## RECOMMENDATION
-        KEEP
-        """
+        return SAMPLE_LLM_RESPONSE
     
     def test_parser_initialization(self, parser):
         """Test parser initialization."""
@@ -81,95 +87,82 @@ class TestReviewParser:
         
         assert len(feedback_items) == 0
 
-    def test_split_feedback_items_bullets(self, parser):
-        """Test splitting feedback items with bullet points."""
-        feedback_text = """
+    @pytest.mark.parametrize("feedback_text", [
+        """
          - First feedback item
          - Second feedback item
          - Third feedback item
+        """,
         """
-        
-        items = parser._split_feedback_items(feedback_text)
-        
-        assert len(items) == 3
-        assert items[0] == "First feedback item"
-        assert items[1] == "Second feedback item"
-        assert items[2] == "Third feedback item"
-
-    def test_split_feedback_items_mixed(self, parser):
-        """Test splitting feedback items with mixed formats."""
-        feedback_text = """
          • First feedback item
          - Second feedback item
          * Third feedback item
-        """
-        
+        """,
+    ], ids=["bullets", "mixed"])
+    def test_split_feedback_items(self, parser, feedback_text):
+        """Test splitting feedback items with bullet points."""
         items = parser._split_feedback_items(feedback_text)
         
-        assert len(items) == 3
-        assert items[0] == "First feedback item"
-        assert items[1] == "Second feedback item"
-        assert items[2] == "Third feedback item"
-
-    def test_should_regenerate_explicit_keep(self, parser):
-        """Test regeneration decision with explicit KEEP."""
-        llm_response = """
-        ## RECOMMENDATION
-        KEEP
-        """
-        
-        should_regenerate = parser._should_regenerate(llm_response)
-        
-        assert should_regenerate == False
+        assert items == ["First feedback item", "Second feedback item", "Third feedback item"]
 
-    def test_should_regenerate_explicit_regenerate(self, parser):
-        """Test regeneration decision with explicit REGENERATE."""
-        llm_response = """
-        ## RECOMMENDATION
-        REGENERATE
-        """
-        
-        should_regenerate = parser._should_regenerate(llm_response)
-        
-        assert should_regenerate == True
+    @pytest.mark.parametrize("llm_response, expected", [
+        ("## RECOMMENDATION\nKEEP", False),
+        ("## RECOMMENDATION\nREGENERATE", True),
+        ("This email needs significant improvement and should be rewritten.", True),
+        ("This is a neutral response without clear recommendation.", False),
+    ], ids=["explicit_keep", "explicit_regenerate", "keywords", "default"])
+    def test_should_regenerate(self, parser, llm_response, expected):
+        """Test regeneration decision from recommendation, keywords, and default."""
+        assert parser._should_regenerate(llm_response) == expected
 
-    def test_should_regenerate_keywords(self, parser):
-        """Test regeneration decision with keywords."""
-        llm_response = """
-        This email needs significant improvement and should be rewritten.
-        """
+    @pytest.mark.parametrize("indent", ["", "        "], ids=["flush_headers", "indented_headers"])
+    def test_parse_review_response_header_forms(self, parser, indent):
+        """Test sections split the same way whether or not the headers are indented."""
+        llm_response = textwrap.indent(SAMPLE_LLM_RESPONSE.replace("KEEP", "REGENERATE"), indent)
         
-        should_regenerate = parser._should_regenerate(llm_response)
+        result = parser.parse_review_response(llm_response=llm_response, email_content="Test email content")
         
-        assert should_regenerate == True
+        assert result.critique.startswith("This email has a good basic structure")
+        assert "## FEEDBACK" not in result.critique
+        assert [item.text for item in result.actionable_feedback][-1] == "Make the subject line more compelling"
+        assert result.should_regenerate == True
 
-    def test_should_regenerate_default(self, parser):
-        """Test regeneration decision default behavior."""
-        llm_response = """
-        This is a neutral response without clear recommendation.
-        """
-        
-        should_regenerate = parser._should_regenerate(llm_response)
-        
-        assert should_regenerate == False
+    @pytest.mark.parametrize("llm_response, expected", [
+        ("## RECOMMENDATION\nKEEP\nThis needs a rewrite.", False),
+        ("## RECOMMENDATION\n    REGENERATE", True),
+        ("## RECOMMENDATION\n\nKEEP\nThis needs a rewrite.", False),
+        ("## RECOMMENDATION KEEP\nThis needs a rewrite.", True),
+    ], ids=["next_line", "next_line_indented", "after_blank_line", "same_line_ignored"])
+    def test_recommendation_must_follow_header_line(self, parser, llm_response, expected):
+        """Test only a recommendation below its header, not on the header line, counts as explicit."""
+        assert parser._should_regenerate(llm_response) == expected
 
-    def test_parse_review_response_success(self, parser, sample_llm_response):
+    def test_parse_review_response_success(self, parser, sample_llm_response, tech_template_info):
         """Test successful complete review response parsing."""
         email_content = "Test email content"
         
         result = parser.parse_review_response(
             llm_response=sample_llm_response,
             email_content=email_content,
-            template_info={"industry": "tech"},
+            template_info=tech_template_info,
             user_context="Test context"
         )
         
-        assert result.email_content == email_content
         assert "This email has a good basic structure" in result.critique
-        assert len(result.actionable_feedback) == 4
-        assert result.should_regenerate == False
-        assert result.template_info == {"industry": "tech"}
-        assert result.user_context == "Test context"
+        actual = {
+            "email_content": result.email_content,
+            "feedback_len": len(result.actionable_feedback),
+            "should_regenerate": result.should_regenerate,
+            "template_info": result.template_info,
+            "user_context": result.user_context,
+        }
+        assert actual == {
+            "email_content": email_content,
+            "feedback_len": 4,
+            "should_regenerate": False,
+            "template_info": {"industry": "tech"},
+            "user_context": "Test context",
+        }
 
     def test_parse_review_response_fallback(self, parser):
         """Test review response parsing fallback when parsing fails."""
@@ -12,6 +12,7 @@ from datetime import datetime
 import yaml
 
 from src.services.scroll_retriever import ScrollRetriever, EmailSnippet
+from src.services.simple_embeddings import SimpleEmbeddings
 from src.utils.file_utils import FileUtils
 
 
@@ -204,6 +205,17 @@ guidance:
         assert snippet.industry == "Test"
         assert snippet.difficulty == "Beginner"
     
+    def test_load_snippets_defers_embeddings_to_first_query(self, temp_snippets_dir):
+        """Test that embeddings are generated on the first query, not at load time."""
+        retriever = ScrollRetriever(snippets_dir=temp_snippets_dir)
+        
+        with patch.object(retriever, '_generate_embeddings') as mock_generate:
+            retriever.load_snippets()
+            mock_generate.assert_not_called()
+            
+            retriever.query("test email")
+            mock_generate.assert_called_once()
+    
     def test_load_snippets_empty_directory(self):
         """Test loading snippets from empty directory."""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -213,6 +225,20 @@ guidance:
             assert count == 0
             assert len(retriever.snippets) == 0
     
+    def test_load_snippets_stops_at_max_snippets(self, temp_snippets_dir):
+        """Test that only as many files as max_snippets are read from a larger directory."""
+        snippet_content = (Path(temp_snippets_dir) / "test_snippet.yaml").read_text()
+        for i in range(5):
+            (Path(temp_snippets_dir) / f"extra_{i}.yaml").write_text(snippet_content)
+    
+        retriever = ScrollRetriever(snippets_dir=temp_snippets_dir, max_snippets=2)
+        with patch.object(retriever, '_load_snippet', wraps=retriever._load_snippet) as mock_load:
+            count = retriever.load_snippets()
+    
+        assert count == 2
+        assert len(retriever.snippets) == 2
+        assert mock_load.call_count == 2
+    
     def test_load_snippets_invalid_metadata(self, temp_snippets_dir):
         """Test loading snippet with invalid metadata."""
         # Create snippet with invalid metadata (missing required fields)
@@ -425,6 +451,104 @@ Content
         assert len(results) == 1  # Only one result due to 0.75 threshold
         assert results[0][0].id == "test1"
     
+    @pytest.mark.parametrize("k", [1, 2, 3, 5])
+    def test_nearest_snippets_match_full_ranking(self, k):
+        """Test that the top-k shortcut returns the same snippets and scores as ranking every score."""
+        retriever = ScrollRetriever()
+        retriever.snippets = [Mock(), Mock(), Mock()]
+        retriever.embeddings = np.array([[0.1, 0.2], [0.3, 0.4], [-0.5, 0.1]])
+        retriever._build_index()
+        queries = np.array([[0.1, 0.2], [0.4, -0.1]])
+        
+        indices, scores = retriever._nearest_snippets(queries, k)
+        expected = SimpleEmbeddings.similarity_batch(queries, retriever.embeddings)
+        expected_indices = np.argsort(-expected, axis=1, kind='stable')[:, :k]
+        
+        np.testing.assert_array_equal(indices, expected_indices)
+        np.testing.assert_array_almost_equal(scores, np.take_along_axis(expected, expected_indices, axis=1), decimal=5)
+    
+    def test_embedding_cache_skips_refit(self, temp_snippets_dir, tmp_path):
+        """Test that a second load with identical snippets reuses the cached fit."""
+        first = ScrollRetriever(snippets_dir=temp_snippets_dir, embedding_cache_dir=str(tmp_path))
+        first.load_snippets()
+        first._ensure_embeddings()
+        
+        second = ScrollRetriever(snippets_dir=temp_snippets_dir, embedding_cache_dir=str(tmp_path))
+        second.load_snippets()
+        with patch.object(SimpleEmbeddings, 'fit', side_effect=AssertionError("refit")):
+            second._ensure_embeddings()
+        
+        assert isinstance(second._normalized_embeddings, np.memmap)
+        np.testing.assert_array_equal(second.embeddings, first.embeddings)
+        np.testing.assert_array_almost_equal(second._normalized_embeddings, first._normalized_embeddings)
+        np.testing.assert_array_almost_equal(
+            second.simple_embeddings.transform(["cold outreach"]),
+            first.simple_embeddings.transform(["cold outreach"])
+        )
+    
+    def test_embedding_cache_write_failure_leaves_no_entry(self, temp_snippets_dir, tmp_path):
+        """Test that a save interrupted mid-write leaves neither partial nor temporary files."""
+        retriever = ScrollRetriever(snippets_dir=temp_snippets_dir, embedding_cache_dir=str(tmp_path))
+        retriever.load_snippets()
+        
+        with patch('src.services.scroll_retriever.np.save', side_effect=OSError("disk full")):
+            retriever._ensure_embeddings()
+        
+        assert retriever.embeddings is not None
+        assert list(tmp_path.iterdir()) == []
+    
+    def test_embedding_disk_cache_is_opt_in(self, temp_snippets_dir):
+        """Test that without an embedding_cache_dir nothing is read from or written to disk."""
+        retriever = ScrollRetriever(snippets_dir=temp_snippets_dir)
+        retriever.load_snippets()
+        
+        with patch.object(retriever, '_load_cached_embeddings') as mock_load, \
+             patch.object(retriever, '_save_cached_embeddings') as mock_save:
+            retriever._ensure_embeddings()
+        
+        assert retriever.embedding_cache_dir is None
+        assert retriever.embeddings is not None
+        mock_load.assert_not_called()
+        mock_save.assert_not_called()
+    
+    def test_hnsw_index_finds_nearest_snippet(self, monkeypatch):
+        """Test that the HNSW index returns the nearest snippet's cosine score."""
+        pytest.importorskip("hnswlib")
+        monkeypatch.setattr("src.services.scroll_retriever.HNSW_MIN_SNIPPETS", 1)
+        
+        retriever = ScrollRetriever()
+        retriever.snippets = [Mock(), Mock(), Mock()]
+        retriever.embeddings = np.array([[0.1, 0.2], [0.3, 0.4], [-0.5, 0.1]])
+        retriever._build_index()
+        queries = np.array([[0.1, 0.2], [0.4, -0.1]])
+        
+        assert retriever._hnsw is not None
+        indices, scores = retriever._nearest_snippets(queries, 1)
+        expected = SimpleEmbeddings.similarity_batch(queries, retriever.embeddings)
+        
+        np.testing.assert_array_equal(indices[:, 0], expected.argmax(axis=1))
+        np.testing.assert_array_almost_equal(scores[:, 0], expected.max(axis=1), decimal=5)
+    
+    def test_query_uses_hnsw_index(self, temp_snippets_dir, monkeypatch):
+        """Test that an unfiltered query goes through the HNSW index and returns the best match."""
+        pytest.importorskip("hnswlib")
+        monkeypatch.setattr("src.services.scroll_retriever.HNSW_MIN_SNIPPETS", 1)
+        
+        retriever = ScrollRetriever(snippets_dir=temp_snippets_dir)
+        retriever.load_snippets()
+        retriever._ensure_embeddings()
+        assert retriever._hnsw is not None
+        
+        with patch.object(retriever, '_calculate_similarities', side_effect=AssertionError("dense scan")):
+            results = retriever.query("test template content", min_similarity=-1.0)
+        
+        expected = SimpleEmbeddings.similarity_batch(
+            retriever.simple_embeddings.transform(["test template content"]), retriever.embeddings
+        )[0]
+        assert len(results) == 1
+        assert results[0][0] is retriever.snippets[int(expected.argmax())]
+        assert results[0][1] == pytest.approx(expected.max(), abs=1e-5)
+    
     def test_query_with_filters(self, temp_snippets_dir):
         """Test querying with filters."""
         retriever = ScrollRetriever(snippets_dir=temp_snippets_dir)
@@ -3,17 +3,35 @@ Tests for ConfigUtils utility class.
 """
 
 import pytest
-import tempfile
 import json
 import os
 from pathlib import Path
 from unittest.mock import patch, MagicMock
-from src.utils.config_utils import ConfigUtils
+from src.utils.config_utils import ConfigUtils, _DOTENV_LOADED
+from src.utils.logging_utils import ERROR
+
+
+JSON_CONFIG_DATA = {"key1": "value1", "key2": "value2"}
+
+
+@pytest.fixture(scope="module")
+def json_config_file(tmp_path_factory):
+    """Write the sample JSON config once per module; tests only read it."""
+    config_file = tmp_path_factory.mktemp("config") / "config.json"
+    config_file.write_text(json.dumps(JSON_CONFIG_DATA))
+    return config_file
 
 
 class TestConfigUtils:
     """Test cases for ConfigUtils utility class."""
     
+    @pytest.fixture(autouse=True)
+    def _reset_loaded_env_files(self):
+        """Forget which .env files were loaded so each test sees a fresh process."""
+        _DOTENV_LOADED.clear()
+        yield
+        _DOTENV_LOADED.clear()
+    
     def test_load_environment_variables_success(self):
         """Test successful environment variable loading."""
         with patch('src.utils.config_utils.load_dotenv') as mock_load_dotenv:
@@ -26,6 +44,15 @@ class TestConfigUtils:
             ConfigUtils.load_environment_variables("test.env")
             mock_load_dotenv.assert_called_once_with("test.env")
     
+    def test_load_environment_variables_loads_each_file_once(self):
+        """Test repeated loads of the same .env file only read it once."""
+        with patch('src.utils.config_utils.load_dotenv') as mock_load_dotenv:
+            ConfigUtils.load_environment_variables("test.env")
+            ConfigUtils.load_environment_variables("test.env")
+            ConfigUtils.load_environment_variables()
+            
+            assert mock_load_dotenv.call_count == 2
+    
     def test_load_environment_variables_failure(self):
         """Test environment variable loading failure."""
         with patch('src.utils.config_utils.load_dotenv', side_effect=Exception("Load failed")):
@@ -42,68 +69,78 @@ class TestConfigUtils:
             assert 'MISSING_KEY' not in result
             assert len(result) == 2
     
+    def test_get_env_variables_skips_masking_when_logging_disabled(self):
+        """Test loaded values are not masked for a log line that would not be printed."""
+        with patch.dict(os.environ, {'TEST_API_KEY': 'sk-1234567890abcdef'}), \
+             patch('src.utils.config_utils.log_enabled', return_value=False), \
+             patch.object(ConfigUtils, '_mask_sensitive_value') as mock_mask:
+            result = ConfigUtils.get_env_variables(['TEST_API_KEY'])
+        
+        assert result == {'TEST_API_KEY': 'sk-1234567890abcdef'}
+        mock_mask.assert_not_called()
+    
     def test_get_env_variables_empty(self):
         """Test getting environment variables when none exist."""
         with patch.dict(os.environ, {}, clear=True):
             result = ConfigUtils.get_env_variables(['TEST_KEY', 'ANOTHER_KEY'])
             assert result == {}
     
-    def test_load_config_from_file_json_success(self):
+    @pytest.mark.io
+    def test_load_config_from_file_json_success(self, json_config_file):
         """Test loading JSON config file successfully."""
-        config_data = {"key1": "value1", "key2": "value2"}
+        result = ConfigUtils.load_config_from_file(str(json_config_file))
+        assert result == JSON_CONFIG_DATA
+    
+    @pytest.mark.io
+    def test_load_config_from_file_rereads_changes(self, tmp_path):
+        """Test every load parses the file afresh, so edits and caller mutations never leak."""
+        config_file = tmp_path / "config.json"
+        config_file.write_text(json.dumps({"key1": "value1"}))
+        
+        first = ConfigUtils.load_config_from_file(str(config_file))
+        first["key1"] = "mutated"
+        assert ConfigUtils.load_config_from_file(str(config_file)) == {"key1": "value1"}
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump(config_data, f)
-            config_file = f.name
+        config_file.write_text(json.dumps({"key1": "value1", "key2": "value2"}))
+        assert ConfigUtils.load_config_from_file(str(config_file)) == {"key1": "value1", "key2": "value2"}
+    
+    @pytest.mark.io
+    def test_load_config_from_file_read_failure(self, tmp_path):
+        """Test a config file that exists but cannot be read returns None."""
+        config_file = tmp_path / "config.json"
+        config_file.write_text(json.dumps({"key1": "value1"}))
         
-        try:
-            result = ConfigUtils.load_config_from_file(config_file)
-            assert result == config_data
-        finally:
-            os.unlink(config_file)
+        with patch.object(Path, 'read_bytes', side_effect=PermissionError("denied")):
+            assert ConfigUtils.load_config_from_file(str(config_file)) is None
     
     def test_load_config_from_file_not_found(self):
         """Test loading config file that doesn't exist."""
         result = ConfigUtils.load_config_from_file("nonexistent.json")
         assert result is None
     
-    def test_load_config_from_file_unsupported_format(self):
+    @pytest.mark.io
+    def test_load_config_from_file_unsupported_format(self, tmp_path):
         """Test loading config file with unsupported format."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-            f.write("some content")
-            config_file = f.name
+        config_file = tmp_path / "config.txt"
+        config_file.write_text("some content")
         
-        try:
-            result = ConfigUtils.load_config_from_file(config_file)
-            assert result is None
-        finally:
-            os.unlink(config_file)
+        result = ConfigUtils.load_config_from_file(str(config_file))
+        assert result is None
     
-    def test_load_config_from_file_invalid_json(self):
+    @pytest.mark.io
+    def test_load_config_from_file_invalid_json(self, tmp_path):
         """Test loading config file with invalid JSON."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            f.write('{"invalid": json}')
-            config_file = f.name
+        config_file = tmp_path / "config.json"
+        config_file.write_text('{"invalid": json}')
         
-        try:
-            result = ConfigUtils.load_config_from_file(config_file)
-            assert result is None
-        finally:
-            os.unlink(config_file)
+        result = ConfigUtils.load_config_from_file(str(config_file))
+        assert result is None
     
-    def test_load_config_from_file_custom_formats(self):
+    @pytest.mark.io
+    def test_load_config_from_file_custom_formats(self, json_config_file):
         """Test loading config file with custom supported formats."""
-        config_data = {"key1": "value1"}
-        
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump(config_data, f)
-            config_file = f.name
-        
-        try:
-            result = ConfigUtils.load_config_from_file(config_file, supported_formats=['.json', '.yaml'])
-            assert result == config_data
-        finally:
-            os.unlink(config_file)
+        result = ConfigUtils.load_config_from_file(str(json_config_file), supported_formats=['.json', '.yaml'])
+        assert result == JSON_CONFIG_DATA
     
     def test_merge_configs_defaults_only(self):
         """Test merging configs with defaults only."""
@@ -154,6 +191,16 @@ class TestConfigUtils:
         result = ConfigUtils.validate_config(config, required_keys)
         assert result is False
     
+    def test_validate_config_fast_fail(self):
+        """Test fast-fail validation stops at the first missing required key."""
+        config = {"required2": "value2"}
+        
+        with patch('src.utils.config_utils.log') as mock_log:
+            result = ConfigUtils.validate_config(config, ["required1", "required2", "required3"], fast_fail=True)
+        
+        assert result is False
+        mock_log.assert_called_once_with("ERROR: Missing required config keys: ['required1']", prefix="ConfigUtils", level=ERROR)
+    
     def test_validate_config_unknown_keys(self):
         """Test config validation with unknown keys (should warn but pass)."""
         config = {"required1": "value1", "unknown1": "value2"}
@@ -168,6 +215,12 @@ class TestConfigUtils:
         result = ConfigUtils.get_nested_config(config, "database.host")
         assert result == "localhost"
     
+    def test_get_nested_config_top_level_key(self):
+        """Test getting a top-level config value without dots."""
+        config = {"database": {"host": "localhost"}, "debug": False}
+        assert ConfigUtils.get_nested_config(config, "debug", default=True) is False
+        assert ConfigUtils.get_nested_config(config, "missing", default=1) == 1
+    
     def test_get_nested_config_deep_nesting(self):
         """Test getting deeply nested config value."""
         config = {"a": {"b": {"c": {"d": "value"}}}}
@@ -230,6 +283,20 @@ class TestConfigUtils:
         assert masked["custom_secret"] == "secr...123"
         assert masked["normal_key"] == "normal_value"
     
+    def test_mask_sensitive_config_ignores_key_case(self):
+        """Test sensitive keys are matched regardless of case."""
+        config = {"OPENAI_API_KEY": "sk-1234567890abcdef", "Db_Password": "secret123"}
+        masked = ConfigUtils.mask_sensitive_config(config)
+        
+        assert masked["OPENAI_API_KEY"] == "sk-1...cdef"
+        assert masked["Db_Password"] == "secr...123"
+    
+    def test_mask_sensitive_config_empty_keys(self):
+        """Test that an empty sensitive key list masks nothing."""
+        config = {"api_key": "sk-1234567890abcdef"}
+        masked = ConfigUtils.mask_sensitive_config(config, sensitive_keys=[])
+        assert masked == config
+
     def test_mask_sensitive_config_short_value(self):
         """Test masking sensitive config with short values."""
         config = {"api_key": "short"}
@@ -242,56 +309,50 @@ class TestConfigUtils:
         masked = ConfigUtils.mask_sensitive_config(config)
         assert masked["api_key"] == "12345"
     
-    def test_export_config_json_success(self):
+    @pytest.mark.io
+    def test_export_config_json_success(self, tmp_path):
         """Test exporting config to JSON file successfully."""
         config = {"key1": "value1", "key2": "value2"}
+        output_file = tmp_path / "config.json"
         
-        with tempfile.NamedTemporaryFile(suffix='.json', delete=False) as f:
-            output_file = f.name
+        success = ConfigUtils.export_config(config, str(output_file), 'json')
+        assert success is True
         
-        try:
-            success = ConfigUtils.export_config(config, output_file, 'json')
-            assert success is True
-            
-            # Verify file was created with correct content
-            with open(output_file, 'r') as f:
-                exported = json.load(f)
-            assert exported == config
-        finally:
-            os.unlink(output_file)
-    
-    def test_export_config_env_success(self):
+        # Verify file was created with correct content
+        assert json.loads(output_file.read_text()) == config
+    
+    @pytest.mark.io
+    def test_export_config_json_round_trips_wide_ints_and_unicode(self, tmp_path):
+        """Test JSON export keeps values orjson cannot encode and non-ASCII text."""
+        config = {"big": 2 ** 70, "name": "Café ☕", 1: "int key"}
+        output_file = tmp_path / "config.json"
+        
+        assert ConfigUtils.export_config(config, str(output_file), 'json') is True
+        assert json.loads(output_file.read_text(encoding='utf-8')) == {"big": 2 ** 70, "name": "Café ☕", "1": "int key"}
+    
+    @pytest.mark.io
+    def test_export_config_env_success(self, tmp_path):
         """Test exporting config to ENV file successfully."""
         config = {"key1": "value1", "key2": "value2"}
+        output_file = tmp_path / "config.env"
         
-        with tempfile.NamedTemporaryFile(suffix='.env', delete=False) as f:
-            output_file = f.name
+        success = ConfigUtils.export_config(config, str(output_file), 'env')
+        assert success is True
         
-        try:
-            success = ConfigUtils.export_config(config, output_file, 'env')
-            assert success is True
-            
-            # Verify file was created with correct content
-            with open(output_file, 'r') as f:
-                content = f.read()
-            assert "key1=value1" in content
-            assert "key2=value2" in content
-        finally:
-            os.unlink(output_file)
-    
-    def test_export_config_unsupported_format(self):
+        # Verify file was created with correct content
+        content = output_file.read_text()
+        assert "key1=value1" in content
+        assert "key2=value2" in content
+    
+    @pytest.mark.io
+    def test_export_config_unsupported_format(self, tmp_path):
         """Test exporting config with unsupported format."""
         config = {"key1": "value1"}
         
-        with tempfile.NamedTemporaryFile(suffix='.txt', delete=False) as f:
-            output_file = f.name
-        
-        try:
-            success = ConfigUtils.export_config(config, output_file, 'xml')
-            assert success is False
-        finally:
-            os.unlink(output_file)
+        success = ConfigUtils.export_config(config, str(tmp_path / "config.txt"), 'xml')
+        assert success is False
     
+    @pytest.mark.io
     def test_export_config_write_failure(self):
         """Test exporting config when file write fails."""
         config = {"key1": "value1"}
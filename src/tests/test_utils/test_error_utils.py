@@ -8,6 +8,23 @@ from unittest.mock import patch, MagicMock
 from src.utils.error_utils import ErrorHandler, safe_operation, retry_operation_decorator
 
 
+@pytest.fixture(scope="module")
+def _patched_sleep():
+    """Replace time.sleep once for this module so retry tests never wait."""
+    sleep = MagicMock()
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(time, "sleep", sleep)
+        yield sleep
+
+
+@pytest.fixture
+def mock_sleep(_patched_sleep):
+    """Return the shared time.sleep mock, cleared so each test only sees its own delays."""
+    _patched_sleep.reset_mock()
+    return _patched_sleep
+
+
+@pytest.mark.usefixtures("mock_sleep")
 class TestErrorHandler:
     """Test cases for ErrorHandler utility class."""
     
@@ -169,6 +186,11 @@ class TestErrorHandler:
             assert result is None
             mock_log.assert_not_called()
     
+    def test_safe_execute_with_arguments(self):
+        """Test safe execution passes args and kwargs to the operation."""
+        result = ErrorHandler.safe_execute(lambda x, y=0: x + y, "test context", args=(2,), kwargs={"y": 3})
+        assert result == 5
+    
     def test_retry_operation_success_first_try(self):
         """Test retry operation that succeeds on first try."""
         def mock_operation():
@@ -188,8 +210,7 @@ class TestErrorHandler:
                 raise ConnectionError("Connection failed")
             return "success"
         
-        with patch('time.sleep'):  # Mock sleep to speed up test
-            result = ErrorHandler.retry_operation(mock_operation, max_retries=3, error_context="test")
+        result = ErrorHandler.retry_operation(mock_operation, max_retries=3, error_context="test")
         
         assert result == "success"
         assert call_count == 3
@@ -199,11 +220,30 @@ class TestErrorHandler:
         def mock_operation():
             raise ConnectionError("Connection failed")
         
-        with patch('time.sleep'):  # Mock sleep to speed up test
-            result = ErrorHandler.retry_operation(mock_operation, max_retries=2, error_context="test")
+        result = ErrorHandler.retry_operation(mock_operation, max_retries=2, error_context="test")
         
         assert result is None
     
+    def test_retry_operation_exponential_backoff(self, mock_sleep):
+        """Test retry delays double per attempt and stop at the cap."""
+        def mock_operation():
+            raise ConnectionError("Connection failed")
+        
+        ErrorHandler.retry_operation(mock_operation, max_retries=4, error_context="test",
+                                     retry_delay=1.0, max_retry_delay=5.0)
+        
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [1.0, 2.0, 4.0, 5.0]
+    
+    def test_retry_operation_with_arguments(self):
+        """Test retry operation passes the same args and kwargs on every attempt."""
+        mock_operation = MagicMock(side_effect=[ConnectionError("Connection failed"), "success"])
+        
+        result = ErrorHandler.retry_operation(mock_operation, max_retries=1, error_context="test",
+                                              args=("a",), kwargs={"b": 1})
+        
+        assert result == "success"
+        assert mock_operation.call_args_list == [(("a",), {"b": 1})] * 2
+    
     def test_retry_operation_non_retryable_error(self):
         """Test retry operation with non-retryable error."""
         def mock_operation():
@@ -270,6 +310,7 @@ class TestSafeOperationDecorator:
         assert result == 8
 
 
+@pytest.mark.usefixtures("mock_sleep")
 class TestRetryOperationDecorator:
     """Test cases for retry_operation_decorator."""
     
@@ -294,8 +335,7 @@ class TestRetryOperationDecorator:
                 raise ConnectionError("Connection failed")
             return "success"
         
-        with patch('time.sleep'):  # Mock sleep to speed up test
-            result = mock_function()
+        result = mock_function()
         
         assert result == "success"
         assert call_count == 3
@@ -306,8 +346,7 @@ class TestRetryOperationDecorator:
         def mock_function():
             raise ConnectionError("Connection failed")
         
-        with patch('time.sleep'):  # Mock sleep to speed up test
-            result = mock_function()
+        result = mock_function()
         
         assert result is None
     
@@ -320,7 +359,7 @@ class TestRetryOperationDecorator:
         result = mock_function(2, 3)
         assert result == 5
     
-    def test_retry_operation_decorator_custom_retry_delay(self):
+    def test_retry_operation_decorator_custom_retry_delay(self, mock_sleep):
         """Test retry_operation_decorator with custom retry delay."""
         call_count = 0
         
@@ -332,8 +371,7 @@ class TestRetryOperationDecorator:
                 raise ConnectionError("Connection failed")
             return "success"
         
-        with patch('time.sleep') as mock_sleep:  # Mock sleep to verify delay
-            result = mock_function()
+        result = mock_function()
         
         assert result == "success"
         assert call_count == 2
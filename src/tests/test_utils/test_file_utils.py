@@ -4,10 +4,38 @@ Tests for FileUtils utility class.
 
 import pytest
 import tempfile
+import io
 import os
+import stat
+import types
+import yaml
 from pathlib import Path
-from unittest.mock import patch, mock_open
-from src.utils.file_utils import FileUtils
+from unittest.mock import DEFAULT, patch
+from src.utils.file_utils import FileUtils, WRITE_BUFFER_SIZE, _load_frontmatter
+
+
+# Minimal os.stat results for validate_file_exists
+REGULAR_FILE_STAT = types.SimpleNamespace(st_mode=stat.S_IFREG | 0o644)
+DIRECTORY_STAT = types.SimpleNamespace(st_mode=stat.S_IFDIR | 0o755)
+
+
+class KeptStringIO(io.StringIO):
+    """In-memory file whose contents stay readable after the with block closes it."""
+    
+    def close(self):
+        pass
+
+
+def fake_open():
+    """Patch builtins.open to hand back one in-memory file instead of a mock_open chain."""
+    return patch('builtins.open', return_value=KeptStringIO())
+
+
+@pytest.fixture
+def path_mocks():
+    """Patch the Path existence checks in one go; tests set the return values they need."""
+    with patch.multiple('pathlib.Path', exists=DEFAULT, is_dir=DEFAULT) as mocks:
+        yield types.SimpleNamespace(**mocks)
 
 
 class TestFileUtils:
@@ -18,7 +46,7 @@ class TestFileUtils:
         test_content = "Test file content"
         test_path = Path("/tmp/test_file.txt")
         
-        with patch('builtins.open', mock_open(read_data=test_content)):
+        with patch('pathlib.Path.read_text', return_value=test_content):
             result = FileUtils.safe_read_file(test_path)
         
         assert result == test_content
@@ -27,7 +55,7 @@ class TestFileUtils:
         """Test file reading when file doesn't exist."""
         test_path = Path("/nonexistent/file.txt")
         
-        with patch('builtins.open', side_effect=FileNotFoundError("File not found")):
+        with patch('pathlib.Path.read_text', side_effect=FileNotFoundError("File not found")):
             result = FileUtils.safe_read_file(test_path)
         
         assert result is None
@@ -36,7 +64,7 @@ class TestFileUtils:
         """Test file reading with permission error."""
         test_path = Path("/protected/file.txt")
         
-        with patch('builtins.open', side_effect=PermissionError("Permission denied")):
+        with patch('pathlib.Path.read_text', side_effect=PermissionError("Permission denied")):
             result = FileUtils.safe_read_file(test_path)
         
         assert result is None
@@ -45,7 +73,7 @@ class TestFileUtils:
         """Test file reading with encoding error."""
         test_path = Path("/tmp/bad_encoding.txt")
         
-        with patch('builtins.open', side_effect=UnicodeDecodeError("utf-8", b"", 0, 1, "invalid")):
+        with patch('pathlib.Path.read_text', side_effect=UnicodeDecodeError("utf-8", b"", 0, 1, "invalid")):
             result = FileUtils.safe_read_file(test_path)
         
         assert result is None
@@ -54,7 +82,7 @@ class TestFileUtils:
         """Test file reading with unexpected error."""
         test_path = Path("/tmp/error.txt")
         
-        with patch('builtins.open', side_effect=Exception("Unexpected error")):
+        with patch('pathlib.Path.read_text', side_effect=Exception("Unexpected error")):
             result = FileUtils.safe_read_file(test_path)
         
         assert result is None
@@ -64,11 +92,44 @@ class TestFileUtils:
         test_content = "Test content to write"
         test_path = Path("/tmp/test_write.txt")
         
-        with patch('pathlib.Path.mkdir'), patch('builtins.open', mock_open()) as mock_file:
+        with patch('pathlib.Path.mkdir'), fake_open() as mock_file:
             result = FileUtils.safe_write_file(test_path, test_content)
         
         assert result is True
-        mock_file.assert_called_once_with(test_path, 'w', encoding='utf-8')
+        mock_file.assert_called_once_with(test_path, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE)
+        assert mock_file.return_value.getvalue() == test_content
+    
+    def test_safe_write_file_creates_missing_parent(self):
+        """Test the parent directory is only created after the first open finds it missing."""
+        test_path = Path("/tmp/missing_dir/test_write.txt")
+        written = KeptStringIO()
+        
+        with patch('pathlib.Path.mkdir') as mock_mkdir, \
+             patch('builtins.open', side_effect=[FileNotFoundError("No such directory"), written]) as mock_file:
+            result = FileUtils.safe_write_file(test_path, "Test content")
+        
+        assert result is True
+        mock_mkdir.assert_called_once_with(parents=True, exist_ok=True)
+        assert mock_file.call_count == 2
+        assert written.getvalue() == "Test content"
+    
+    def test_safe_write_file_existing_parent_skips_mkdir(self):
+        """Test writing into an existing directory does not call mkdir."""
+        with patch('pathlib.Path.mkdir') as mock_mkdir, fake_open():
+            assert FileUtils.safe_write_file(Path("/tmp/test_write.txt"), "Test content") is True
+        
+        mock_mkdir.assert_not_called()
+    
+    @pytest.mark.io
+    def test_safe_file_round_trip_real_io(self, tmp_path):
+        """Test the real write, validate and read paths together on a file larger than the write buffer."""
+        test_path = tmp_path / "nested" / "round_trip.txt"
+        test_content = "x" * (WRITE_BUFFER_SIZE + 1) + "\nlast line é"
+        
+        assert FileUtils.safe_write_file(test_path, test_content) is True
+        assert FileUtils.validate_file_exists(test_path) is True
+        assert FileUtils.get_file_size(test_path) == len(test_content.encode('utf-8'))
+        assert FileUtils.safe_read_file(test_path) == test_content
     
     def test_safe_write_file_permission_error(self):
         """Test file writing with permission error."""
@@ -90,48 +151,67 @@ class TestFileUtils:
         
         assert result is False
     
-    def test_find_files_by_extension_success(self):
-        """Test finding files by extension."""
-        test_dir = Path("/tmp/test_dir")
+    @pytest.mark.io
+    def test_find_files_by_extension_success(self, tmp_path):
+        """Test finding files by extension, including in subdirectories."""
+        (tmp_path / "subdir" / "nested").mkdir(parents=True)
         test_files = [
-            Path("/tmp/test_dir/file1.yaml"),
-            Path("/tmp/test_dir/file2.yaml"),
-            Path("/tmp/test_dir/subdir/file3.yaml")
+            tmp_path / "file1.yaml",
+            tmp_path / "subdir" / "file2.yaml",
+            tmp_path / "subdir" / "nested" / "file3.yaml",
         ]
+        for test_file in test_files:
+            test_file.write_text("content")
+        (tmp_path / "notes.txt").write_text("content")
         
-        with patch('pathlib.Path.exists', return_value=True), \
-             patch('pathlib.Path.is_dir', return_value=True), \
-             patch('pathlib.Path.rglob', return_value=test_files):
-            result = FileUtils.find_files_by_extension(test_dir, '.yaml')
+        result = FileUtils.find_files_by_extension(tmp_path, '.yaml')
         
-        assert result == test_files
+        assert sorted(result) == sorted(test_files)
     
-    def test_find_files_by_extension_directory_not_exists(self):
+    @pytest.mark.io
+    def test_find_files_by_extension_skips_unreadable_directory(self, tmp_path):
+        """Test an unreadable subdirectory is skipped without aborting the walk."""
+        (tmp_path / "locked").mkdir()
+        (tmp_path / "locked" / "hidden.yaml").write_text("content")
+        (tmp_path / "visible.yaml").write_text("content")
+        real_scandir = os.scandir
+        
+        def scandir(path):
+            if Path(path).name == "locked":
+                raise PermissionError("Permission denied")
+            return real_scandir(path)
+        
+        with patch('src.utils.file_utils.os.scandir', side_effect=scandir):
+            result = FileUtils.find_files_by_extension(tmp_path, '.yaml')
+        
+        assert result == [tmp_path / "visible.yaml"]
+    
+    def test_find_files_by_extension_directory_not_exists(self, path_mocks):
         """Test finding files when directory doesn't exist."""
         test_dir = Path("/nonexistent/dir")
+        path_mocks.exists.return_value = False
         
-        with patch('pathlib.Path.exists', return_value=False):
-            result = FileUtils.find_files_by_extension(test_dir, '.yaml')
+        result = FileUtils.find_files_by_extension(test_dir, '.yaml')
         
         assert result == []
     
-    def test_find_files_by_extension_not_directory(self):
+    def test_find_files_by_extension_not_directory(self, path_mocks):
         """Test finding files when path is not a directory."""
         test_dir = Path("/tmp/file.txt")
+        path_mocks.exists.return_value = True
+        path_mocks.is_dir.return_value = False
         
-        with patch('pathlib.Path.exists', return_value=True), \
-             patch('pathlib.Path.is_dir', return_value=False):
-            result = FileUtils.find_files_by_extension(test_dir, '.yaml')
+        result = FileUtils.find_files_by_extension(test_dir, '.yaml')
         
         assert result == []
     
-    def test_find_files_by_extension_error(self):
+    def test_find_files_by_extension_error(self, path_mocks):
         """Test finding files with unexpected error."""
         test_dir = Path("/tmp/test_dir")
+        path_mocks.exists.return_value = True
+        path_mocks.is_dir.return_value = True
         
-        with patch('pathlib.Path.exists', return_value=True), \
-             patch('pathlib.Path.is_dir', return_value=True), \
-             patch('pathlib.Path.rglob', side_effect=Exception("Unexpected error")):
+        with patch('src.utils.file_utils.os.scandir', side_effect=Exception("Unexpected error")):
             result = FileUtils.find_files_by_extension(test_dir, '.yaml')
         
         assert result == []
@@ -157,6 +237,23 @@ This is the actual content after the frontmatter."""
         }
         assert text_content.strip() == "This is the actual content after the frontmatter."
     
+    def test_parse_yaml_frontmatter_parses_repeated_content_once(self):
+        """Test repeated frontmatter is parsed once and each caller gets its own metadata."""
+        content = """---
+tags: ["cached"]
+---
+
+Body text."""
+        _load_frontmatter.cache_clear()
+        
+        with patch('src.utils.file_utils.yaml.load', wraps=yaml.load) as mock_load:
+            first, _ = FileUtils.parse_yaml_frontmatter(content)
+            first["tags"].append("mutated")
+            second, _ = FileUtils.parse_yaml_frontmatter(content)
+        
+        assert mock_load.call_count == 1
+        assert second == {"tags": ["cached"]}
+    
     def test_parse_yaml_frontmatter_without_frontmatter(self):
         """Test parsing content without frontmatter."""
         content = "This is content without any frontmatter."
@@ -193,13 +290,21 @@ This is the content."""
         assert metadata == {}
         assert text_content == content
     
+    def test_parse_yaml_frontmatter_end_marker_must_be_own_line(self):
+        """Test '---' inside a line is not taken as the end marker, and CRLF markers still close."""
+        content = "---\r\nnote: a---b\r\n  ---  \r\nBody with --- inside\r\n---\r\n"
+        
+        metadata, text_content = FileUtils.parse_yaml_frontmatter(content)
+        
+        assert metadata == {"note": "a---b"}
+        assert text_content == "Body with --- inside\r\n---\r\n"
+    
     def test_validate_file_exists_success(self):
         """Test file validation when file exists and is readable."""
         test_path = Path("/tmp/test_file.txt")
         
-        with patch('pathlib.Path.exists', return_value=True), \
-             patch('pathlib.Path.is_file', return_value=True), \
-             patch('builtins.open', mock_open()):
+        with patch('src.utils.file_utils.os.stat', return_value=REGULAR_FILE_STAT), \
+             patch('src.utils.file_utils.os.access', return_value=True):
             result = FileUtils.validate_file_exists(test_path)
         
         assert result is True
@@ -208,7 +313,7 @@ This is the content."""
         """Test file validation when file doesn't exist."""
         test_path = Path("/nonexistent/file.txt")
         
-        with patch('pathlib.Path.exists', return_value=False):
+        with patch('src.utils.file_utils.os.stat', side_effect=FileNotFoundError("No such file")):
             result = FileUtils.validate_file_exists(test_path)
         
         assert result is False
@@ -217,8 +322,7 @@ This is the content."""
         """Test file validation when path is not a file."""
         test_path = Path("/tmp/directory")
         
-        with patch('pathlib.Path.exists', return_value=True), \
-             patch('pathlib.Path.is_file', return_value=False):
+        with patch('src.utils.file_utils.os.stat', return_value=DIRECTORY_STAT):
             result = FileUtils.validate_file_exists(test_path)
         
         assert result is False
@@ -227,9 +331,8 @@ This is the content."""
         """Test file validation when file is not readable."""
         test_path = Path("/tmp/unreadable.txt")
         
-        with patch('pathlib.Path.exists', return_value=True), \
-             patch('pathlib.Path.is_file', return_value=True), \
-             patch('builtins.open', side_effect=PermissionError("Permission denied")):
+        with patch('src.utils.file_utils.os.stat', return_value=REGULAR_FILE_STAT), \
+             patch('src.utils.file_utils.os.access', return_value=False):
             result = FileUtils.validate_file_exists(test_path)
         
         assert result is False
@@ -278,21 +381,23 @@ This is the content."""
         test_content = "Test content with special chars: éñ"
         test_path = Path("/tmp/test_file.txt")
         
-        with patch('builtins.open', mock_open(read_data=test_content)):
+        with patch('pathlib.Path.read_text', return_value=test_content) as mock_read_text:
             result = FileUtils.safe_read_file(test_path, encoding='latin-1')
         
         assert result == test_content
+        mock_read_text.assert_called_once_with(encoding='latin-1')
     
     def test_safe_write_file_with_custom_encoding(self):
         """Test file writing with custom encoding."""
         test_content = "Test content with special chars: éñ"
         test_path = Path("/tmp/test_write.txt")
         
-        with patch('pathlib.Path.mkdir'), patch('builtins.open', mock_open()) as mock_file:
+        with patch('pathlib.Path.mkdir'), fake_open() as mock_file:
             result = FileUtils.safe_write_file(test_path, test_content, encoding='latin-1')
         
         assert result is True
-        mock_file.assert_called_once_with(test_path, 'w', encoding='latin-1')
+        mock_file.assert_called_once_with(test_path, 'w', encoding='latin-1', buffering=WRITE_BUFFER_SIZE)
+        assert mock_file.return_value.getvalue() == test_content
     
     def test_parse_yaml_frontmatter_empty_content(self):
         """Test parsing YAML frontmatter with empty content."""
@@ -315,13 +420,11 @@ use_case: "Test Case"
         assert metadata == {"tags": ["test"], "use_case": "Test Case"}
         assert text_content.strip() == ""
     
-    def test_find_files_by_extension_empty_result(self):
+    @pytest.mark.io
+    def test_find_files_by_extension_empty_result(self, tmp_path):
         """Test finding files by extension with no matches."""
-        test_dir = Path("/tmp/empty_dir")
+        (tmp_path / "notes.txt").write_text("content")
         
-        with patch('pathlib.Path.exists', return_value=True), \
-             patch('pathlib.Path.is_dir', return_value=True), \
-             patch('pathlib.Path.rglob', return_value=[]):
-            result = FileUtils.find_files_by_extension(test_dir, '.yaml')
+        result = FileUtils.find_files_by_extension(tmp_path, '.yaml')
         
         assert result == [] 
\ No newline at end of file
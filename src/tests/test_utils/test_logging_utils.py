@@ -5,7 +5,8 @@ Tests for logging_utils utility.
 import pytest
 from unittest.mock import patch
 import sys
-from utils.logging_utils import log, log_error, log_warning, log_info, log_debug, log_success
+from utils import logging_utils
+from utils.logging_utils import log, log_enabled, set_log_enabled, set_log_level, log_error, log_warning, log_info, log_debug, log_success
 
 
 class TestLoggingUtils:
@@ -84,14 +85,6 @@ class TestLoggingUtils:
         
         assert mock_print.call_args_list == expected_calls
 
-    @patch('builtins.print')
-    def test_log_error_default_prefix(self, mock_print):
-        """Test log_error function with default prefix."""
-        message = "Test error message"
-        log_error(message)
-        
-        mock_print.assert_called_once_with("[Hedwig] ERROR: Test error message", file=sys.stderr)
-    
     @patch('builtins.print')
     def test_log_error_with_exception(self, mock_print):
         """Test log_error function with exception."""
@@ -101,79 +94,87 @@ class TestLoggingUtils:
         
         mock_print.assert_called_once_with("[Hedwig] ERROR: Test error message - Exception: ValueError: Test exception", file=sys.stderr)
     
-    @patch('builtins.print')
-    def test_log_warning_default_prefix(self, mock_print):
-        """Test log_warning function with default prefix."""
-        message = "Test warning message"
-        log_warning(message)
-        
-        mock_print.assert_called_once_with("[Hedwig] WARNING: Test warning message")
-    
-    @patch('builtins.print')
-    def test_log_info_default_prefix(self, mock_print):
-        """Test log_info function with default prefix."""
-        message = "Test info message"
-        log_info(message)
-        
-        mock_print.assert_called_once_with("[Hedwig] INFO: Test info message")
-    
-    @patch('builtins.print')
-    def test_log_debug_default_prefix(self, mock_print):
-        """Test log_debug function with default prefix."""
-        message = "Test debug message"
-        log_debug(message)
-        
-        mock_print.assert_called_once_with("[Hedwig] DEBUG: Test debug message")
-    
-    @patch('builtins.print')
-    def test_log_success_default_prefix(self, mock_print):
-        """Test log_success function with default prefix."""
-        message = "Test success message"
-        log_success(message)
-        
-        mock_print.assert_called_once_with("[Hedwig] SUCCESS: Test success message")
-    
-    @patch('builtins.print')
-    def test_log_error_custom_prefix(self, mock_print):
-        """Test log_error function with custom prefix."""
-        message = "Test error message"
-        prefix = "CustomPrefix"
-        log_error(message, prefix)
-        
-        mock_print.assert_called_once_with("[CustomPrefix] ERROR: Test error message", file=sys.stderr)
-    
-    @patch('builtins.print')
-    def test_log_warning_custom_prefix(self, mock_print):
-        """Test log_warning function with custom prefix."""
-        message = "Test warning message"
-        prefix = "CustomPrefix"
-        log_warning(message, prefix)
-        
-        mock_print.assert_called_once_with("[CustomPrefix] WARNING: Test warning message")
-    
-    @patch('builtins.print')
-    def test_log_info_custom_prefix(self, mock_print):
-        """Test log_info function with custom prefix."""
-        message = "Test info message"
-        prefix = "CustomPrefix"
-        log_info(message, prefix)
-        
-        mock_print.assert_called_once_with("[CustomPrefix] INFO: Test info message")
-    
-    @patch('builtins.print')
-    def test_log_debug_custom_prefix(self, mock_print):
-        """Test log_debug function with custom prefix."""
-        message = "Test debug message"
-        prefix = "CustomPrefix"
-        log_debug(message, prefix)
-        
-        mock_print.assert_called_once_with("[CustomPrefix] DEBUG: Test debug message")
-    
-    @patch('builtins.print')
-    def test_log_success_custom_prefix(self, mock_print):
-        """Test log_success function with custom prefix."""
-        message = "Test success message"
-        prefix = "CustomPrefix"
-        log_success(message, prefix)
-        
-        mock_print.assert_called_once_with("[CustomPrefix] SUCCESS: Test success message") 
\ No newline at end of file
+    @pytest.mark.parametrize("prefix", [None, "CustomPrefix"], ids=["default_prefix", "custom_prefix"])
+    @pytest.mark.parametrize("log_fn, level, to_stderr", [
+        (log_error, "ERROR", True),
+        (log_warning, "WARNING", False),
+        (log_info, "INFO", False),
+        (log_debug, "DEBUG", False),
+        (log_success, "SUCCESS", False),
+    ], ids=["error", "warning", "info", "debug", "success"])
+    @patch('builtins.print')
+    def test_log_level_functions(self, mock_print, log_fn, level, to_stderr, prefix):
+        """Test each level function formats its tag and prefix, with errors going to stderr."""
+        message = f"Test {level.lower()} message"
+        if prefix:
+            log_fn(message, prefix)
+        else:
+            log_fn(message)
+        
+        expected_kwargs = {"file": sys.stderr} if to_stderr else {}
+        mock_print.assert_called_once_with(f"[{prefix or 'Hedwig'}] {level}: {message}", **expected_kwargs)
+    
+    @patch('builtins.print')
+    def test_log_disabled(self, mock_print):
+        """Test every log function prints nothing while disabled and resumes once re-enabled."""
+        set_log_enabled(False)
+        try:
+            assert log_enabled() is False
+            assert log_enabled(logging_utils.ERROR) is False
+            log("Hidden message")
+            log("Hidden error", level=logging_utils.ERROR)
+            log_error("Hidden error")
+            log_warning("Hidden warning")
+            log_info("Hidden info")
+            log_debug("Hidden debug")
+            log_success("Hidden success")
+            mock_print.assert_not_called()
+        finally:
+            set_log_enabled(True)
+        
+        assert log_enabled() is True
+        log("Visible message")
+        mock_print.assert_called_once_with("[Hedwig] Visible message")
+    
+    @pytest.mark.parametrize("level", ["WARNING", "warning", 30, "30"])
+    @patch('builtins.print')
+    def test_log_level_threshold(self, mock_print, monkeypatch, level):
+        """Test messages below the threshold are dropped, including plain log() info lines."""
+        # Restore whatever threshold was active, which HEDWIG_LOG_LEVEL may have set
+        monkeypatch.setattr(logging_utils, "_LOG_LEVEL", logging_utils._LOG_LEVEL)
+        set_log_level(level)
+        
+        assert log_enabled() is False
+        assert log_enabled(logging_utils.ERROR) is True
+        log("Loaded config")
+        log("WARNING: the level is passed explicitly, not read from the text")
+        log_info("Info message")
+        log_debug("Debug message")
+        log_success("Success message")
+        mock_print.assert_not_called()
+        
+        log("WARNING: Config file not found", level=logging_utils.WARNING)
+        log_warning("Warning message")
+        log_error("Error message")
+        assert mock_print.call_count == 3
+    
+    @pytest.mark.parametrize("value,expected", [
+        ("", logging_utils.DEBUG),
+        ("  ", logging_utils.DEBUG),
+        ("error", logging_utils.ERROR),
+        ("25", logging_utils.SUCCESS),
+    ])
+    @patch('builtins.print')
+    def test_env_log_level(self, mock_print, monkeypatch, value, expected):
+        """Test HEDWIG_LOG_LEVEL parsing, treating an empty value as unset."""
+        monkeypatch.setenv("HEDWIG_LOG_LEVEL", value)
+        assert logging_utils._env_log_level() == expected
+        mock_print.assert_not_called()
+    
+    @pytest.mark.parametrize("value", ["VERBOSE", "loud", "-"])
+    @patch('builtins.print')
+    def test_env_log_level_unknown_falls_back_to_debug(self, mock_print, monkeypatch, value):
+        """Test an unknown HEDWIG_LOG_LEVEL logs everything and warns instead of failing import."""
+        monkeypatch.setenv("HEDWIG_LOG_LEVEL", value)
+        assert logging_utils._env_log_level() == logging_utils.DEBUG
+        mock_print.assert_called_once_with(f"[Hedwig] WARNING: Unknown HEDWIG_LOG_LEVEL {value!r}, logging everything")
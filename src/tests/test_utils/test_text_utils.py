@@ -2,6 +2,7 @@
 Tests for text_utils utility.
 """
 
+import re
 import pytest
 from utils.text_utils import TextProcessor
 
@@ -17,7 +18,27 @@ class TestTextProcessor:
         assert TextProcessor.clean_special_chars('123@#$', keep_chars='@') == '123@'
         assert TextProcessor.clean_special_chars('NoSpecials') == 'NoSpecials'
 
+    @pytest.mark.parametrize("keep_chars", ["", "-", "@.", "]^\\"])
+    def test_clean_special_chars_ascii_matches_regex(self, keep_chars):
+        all_ascii = ''.join(map(chr, range(128)))
+        expected = re.sub(rf'[^\w\s{re.escape(keep_chars)}]', '', all_ascii)
+        assert TextProcessor.clean_special_chars(all_ascii, keep_chars=keep_chars) == expected
+
+    def test_clean_special_chars_unicode(self):
+        assert TextProcessor.clean_special_chars('Café — naïve “quote”') == 'Café  naïve quote'
+
     def test_preprocess_text(self):
         assert TextProcessor.preprocess_text('  Hello,   world!  ') == 'hello world'
         assert TextProcessor.preprocess_text('\nA-B_C.D!\t', ) == 'a-b_cd'
-        assert TextProcessor.preprocess_text('NoSpecials') == 'nospecials' 
\ No newline at end of file
+        assert TextProcessor.preprocess_text('NoSpecials') == 'nospecials'
+
+    @pytest.mark.parametrize("text", ["  Don't   e-mail, it's   spam!  ", "Café — naïve “quote”\t ok"])
+    def test_preprocess_text_matches_separate_steps(self, text):
+        expected = TextProcessor.clean_special_chars(TextProcessor.normalize_whitespace(text.lower()), keep_chars='-')
+        assert TextProcessor.preprocess_text(text) == expected
+
+    def test_find_phrase_context_with_precomputed_lowercase(self):
+        text = 'Intro. The Quick Brown fox jumps. Outro.'
+        with_lower = TextProcessor.find_phrase_context(text, 'quick brown', context_chars=4, text_lower=text.lower())
+        assert with_lower == TextProcessor.find_phrase_context(text, 'quick brown', context_chars=4) == 'The Quick Brown fox'
+        assert TextProcessor.find_phrase_context(text, 'missing', text_lower=text.lower()) == ''
@@ -6,42 +6,14 @@ components from YAML template files.
 """
 
 import pytest
-import tempfile
-from pathlib import Path
+import yaml
 from unittest.mock import patch, mock_open
 
+from utils import file_utils, yaml_template_parser
 from utils.yaml_template_parser import YAMLTemplateParser
 
 
-class TestYAMLTemplateParser:
-    """Test YAMLTemplateParser class."""
-    
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.parser = YAMLTemplateParser()
-        
-        # Sample valid YAML data
-        self.valid_yaml_data = {
-            'metadata': {
-                'tags': ['test', 'email'],
-                'use_case': 'Test Case',
-                'tone': 'Professional',
-                'industry': 'Tech',
-                'notes': 'Test template notes'
-            },
-            'template': {
-                'subject': 'Test Subject',
-                'content': 'Test email content'
-            },
-            'guidance': {
-                'tone': 'professional',
-                'style': 'formal'
-            }
-        }
-    
-    def test_parse_template_valid(self):
-        """Test parsing valid YAML template."""
-        valid_yaml = """
+VALID_TEMPLATE_YAML = """
 metadata:
   tags: ["test", "email"]
   use_case: "Test Case"
@@ -53,124 +25,197 @@ template:
 guidance:
   tone: "professional"
 """
-        
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            f.write(valid_yaml)
-            file_path = Path(f.name)
-        
-        try:
-            result = self.parser.parse_template(file_path)
-            assert 'metadata' in result
-            assert 'template' in result
-            assert 'guidance' in result
-            assert result['metadata']['tags'] == ['test', 'email']
-            assert result['template']['subject'] == 'Test Subject'
-        finally:
-            file_path.unlink()
-    
-    def test_parse_template_missing_sections(self):
-        """Test parsing YAML with missing required sections."""
-        invalid_yaml = """
+
+MISSING_SECTIONS_YAML = """
 metadata:
   tags: ["test"]
 # Missing template section (required)
 guidance:
   tone: "professional"
 """
-        
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            f.write(invalid_yaml)
-            file_path = Path(f.name)
-        
-        try:
-            # Should not raise error due to ErrorHandler
-            result = self.parser.parse_template(file_path)
-            assert result is None  # ErrorHandler returns None on error
-        finally:
-            file_path.unlink()
-    
-    def test_parse_template_invalid_yaml(self):
-        """Test parsing invalid YAML."""
-        invalid_yaml = """
+
+INVALID_YAML = """
 metadata:
   tags: ["test"
   # Missing closing bracket
 template:
   content: "Test content"
 """
+
+
+@pytest.fixture(scope="module")
+def parser():
+    """Create one YAMLTemplateParser per module; it holds no per-parse state."""
+    return YAMLTemplateParser()
+
+
+@pytest.fixture(scope="module")
+def valid_yaml_data():
+    """Sample valid YAML data, built once per module; tests only read it."""
+    return {
+        'metadata': {
+            'tags': ['test', 'email'],
+            'use_case': 'Test Case',
+            'tone': 'Professional',
+            'industry': 'Tech',
+            'notes': 'Test template notes'
+        },
+        'template': {
+            'subject': 'Test Subject',
+            'content': 'Test email content'
+        },
+        'guidance': {
+            'tone': 'professional',
+            'style': 'formal'
+        }
+    }
+
+
+class TestYAMLTemplateParser:
+    """Test YAMLTemplateParser class."""
+    
+    def test_parse_template_valid(self, parser):
+        """Test parsing valid YAML template."""
+        result = parser.parse_template_from_string(VALID_TEMPLATE_YAML)
+        assert 'metadata' in result
+        assert 'template' in result
+        assert 'guidance' in result
+        assert result['metadata']['tags'] == ['test', 'email']
+        assert result['template']['subject'] == 'Test Subject'
+    
+    @pytest.mark.io
+    def test_parse_template_from_file(self, parser, tmp_path):
+        """Test parsing a YAML template from disk gives the same result as from text."""
+        file_path = tmp_path / "template.yaml"
+        file_path.write_text(VALID_TEMPLATE_YAML, encoding='utf-8')
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            f.write(invalid_yaml)
-            file_path = Path(f.name)
+        result = parser.parse_template(file_path)
+        assert result == parser.parse_template_from_string(VALID_TEMPLATE_YAML)
+    
+    @pytest.mark.io
+    def test_parse_template_caches_unchanged_file(self, parser, tmp_path):
+        """Test an unchanged file is parsed once, and an edited file is parsed again."""
+        file_path = tmp_path / "template.yaml"
+        file_path.write_text(VALID_TEMPLATE_YAML, encoding='utf-8')
+        
+        with patch('utils.yaml_template_parser.yaml.load', wraps=yaml.load) as mock_load:
+            first = parser.parse_template(file_path)
+            first['metadata']['tags'].append('mutated')
+            second = parser.parse_template(file_path)
+            assert mock_load.call_count == 1
+            assert second['metadata']['tags'] == ['test', 'email']
+            
+            file_path.write_text(VALID_TEMPLATE_YAML.replace('Test Subject', 'Edited Subject'), encoding='utf-8')
+            edited = parser.parse_template(file_path)
+            assert mock_load.call_count == 2
+            assert edited['template']['subject'] == 'Edited Subject'
+    
+    def test_parse_template_missing_sections(self, parser):
+        """Test parsing YAML with missing required sections."""
+        # Should not raise error due to ErrorHandler
+        result = parser.parse_template_from_string(MISSING_SECTIONS_YAML)
+        assert result is None  # ErrorHandler returns None on error
+    
+    @pytest.mark.io
+    def test_parse_template_file_missing_sections(self, parser, tmp_path):
+        """Test parsing a YAML file with missing required sections."""
+        file_path = tmp_path / "template.yaml"
+        file_path.write_text(MISSING_SECTIONS_YAML, encoding='utf-8')
+        
+        result = parser.parse_template(file_path)
+        assert result is None  # ErrorHandler returns None on error
+    
+    def test_parse_template_invalid_yaml(self, parser):
+        """Test parsing invalid YAML."""
+        result = parser.parse_template_from_string(INVALID_YAML)
+        assert result is None  # ErrorHandler returns None on error
+    
+    @pytest.mark.io
+    def test_parse_template_file_invalid_yaml(self, parser, tmp_path):
+        """Test parsing an invalid YAML file."""
+        file_path = tmp_path / "template.yaml"
+        file_path.write_text(INVALID_YAML, encoding='utf-8')
+        
+        result = parser.parse_template(file_path)
+        assert result is None  # ErrorHandler returns None on error
+    
+    @pytest.mark.parametrize("module", [yaml_template_parser, file_utils], ids=["template_parser", "frontmatter"])
+    def test_uses_libyaml_loader_when_available(self, module):
+        """Test YAML is loaded with the C-accelerated safe loader whenever libyaml is installed."""
+        expected = yaml.CSafeLoader if yaml.__with_libyaml__ else yaml.SafeLoader
+        assert module._SafeLoader is expected
+    
+    def test_extract_all_matches_individual_accessors(self, parser, valid_yaml_data):
+        """Test extract_all returns the same components as the individual accessors."""
+        bundle = parser.extract_all(valid_yaml_data)
         
-        try:
-            result = self.parser.parse_template(file_path)
-            assert result is None  # ErrorHandler returns None on error
-        finally:
-            file_path.unlink()
+        assert bundle.metadata == parser.get_metadata(valid_yaml_data)
+        assert bundle.guidance == parser.get_guidance(valid_yaml_data)
+        assert bundle.content == parser.get_template_content(valid_yaml_data)
+        assert bundle.matching == parser.get_matching_content(valid_yaml_data)
     
-    def test_get_template_content_with_subject(self):
+    def test_get_template_content_with_subject(self, parser, valid_yaml_data):
         """Test extracting template content with subject."""
-        result = self.parser.get_template_content(self.valid_yaml_data)
+        result = parser.get_template_content(valid_yaml_data)
         expected = "Subject: Test Subject\n\nTest email content"
         assert result == expected
     
-    def test_get_template_content_without_subject(self):
+    def test_get_template_content_without_subject(self, parser):
         """Test extracting template content without subject."""
         yaml_data = {
             'template': {
                 'content': 'Test email content'
             }
         }
-        result = self.parser.get_template_content(yaml_data)
+        result = parser.get_template_content(yaml_data)
         assert result == 'Test email content'
     
-    def test_get_template_content_empty(self):
+    def test_get_template_content_empty(self, parser):
         """Test extracting template content from empty template."""
         yaml_data = {'template': {}}
-        result = self.parser.get_template_content(yaml_data)
+        result = parser.get_template_content(yaml_data)
         assert result == ''
     
-    def test_get_metadata(self):
+    def test_get_metadata(self, parser, valid_yaml_data):
         """Test extracting metadata."""
-        result = self.parser.get_metadata(self.valid_yaml_data)
+        result = parser.get_metadata(valid_yaml_data)
         assert result['tags'] == ['test', 'email']
         assert result['use_case'] == 'Test Case'
         assert result['tone'] == 'Professional'
         assert result['industry'] == 'Tech'
     
-    def test_get_metadata_empty(self):
+    def test_get_metadata_empty(self, parser):
         """Test extracting metadata from empty data."""
         yaml_data = {}
-        result = self.parser.get_metadata(yaml_data)
+        result = parser.get_metadata(yaml_data)
         assert result == {}
     
-    def test_get_guidance(self):
+    def test_get_guidance(self, parser, valid_yaml_data):
         """Test extracting guidance."""
-        result = self.parser.get_guidance(self.valid_yaml_data)
+        result = parser.get_guidance(valid_yaml_data)
         assert result['tone'] == 'professional'
         assert result['style'] == 'formal'
     
-    def test_get_guidance_empty(self):
+    def test_get_guidance_empty(self, parser):
         """Test extracting guidance from empty data."""
         yaml_data = {}
-        result = self.parser.get_guidance(yaml_data)
+        result = parser.get_guidance(yaml_data)
         assert result == {}
     
-    def test_validate_template_valid(self):
+    def test_validate_template_valid(self, parser, valid_yaml_data):
         """Test validating valid template."""
-        assert self.parser.validate_template(self.valid_yaml_data) is True
+        assert parser.validate_template(valid_yaml_data) is True
     
-    def test_validate_template_missing_metadata(self):
+    def test_validate_template_missing_metadata(self, parser):
         """Test validating template with missing metadata."""
         invalid_data = {
             'template': {
                 'content': 'Test content'
             }
         }
-        assert self.parser.validate_template(invalid_data) is False
+        assert parser.validate_template(invalid_data) is False
     
-    def test_validate_template_missing_template(self):
+    def test_validate_template_missing_template(self, parser):
         """Test validating template with missing template section."""
         invalid_data = {
             'metadata': {
@@ -180,9 +225,9 @@ template:
                 'industry': 'Tech'
             }
         }
-        assert self.parser.validate_template(invalid_data) is False
+        assert parser.validate_template(invalid_data) is False
     
-    def test_validate_template_missing_required_fields(self):
+    def test_validate_template_missing_required_fields(self, parser):
         """Test validating template with missing required metadata fields."""
         invalid_data = {
             'metadata': {
@@ -194,9 +239,9 @@ template:
                 'content': 'Test content'
             }
         }
-        assert self.parser.validate_template(invalid_data) is False
+        assert parser.validate_template(invalid_data) is False
     
-    def test_validate_template_empty_content(self):
+    def test_validate_template_empty_content(self, parser):
         """Test validating template with empty content."""
         invalid_data = {
             'metadata': {
@@ -209,11 +254,11 @@ template:
                 'content': ''  # Empty content
             }
         }
-        assert self.parser.validate_template(invalid_data) is False
+        assert parser.validate_template(invalid_data) is False
     
-    def test_get_matching_content_full(self):
+    def test_get_matching_content_full(self, parser, valid_yaml_data):
         """Test getting matching content with all components."""
-        result = self.parser.get_matching_content(self.valid_yaml_data)
+        result = parser.get_matching_content(valid_yaml_data)
         
         # Should contain tags, notes, subject, and content
         assert 'test email' in result  # Tags
@@ -221,7 +266,7 @@ template:
         assert 'Subject: Test Subject' in result  # Subject
         assert 'Test email content' in result  # Content
     
-    def test_get_matching_content_minimal(self):
+    def test_get_matching_content_minimal(self, parser):
         """Test getting matching content with minimal data."""
         minimal_data = {
             'metadata': {
@@ -231,19 +276,19 @@ template:
                 'content': 'Test content'
             }
         }
-        result = self.parser.get_matching_content(minimal_data)
+        result = parser.get_matching_content(minimal_data)
         
         assert 'test' in result  # Tags
         assert 'Test content' in result  # Content
         assert 'Subject:' not in result  # No subject
     
-    def test_get_matching_content_empty(self):
+    def test_get_matching_content_empty(self, parser):
         """Test getting matching content from empty data."""
         empty_data = {}
-        result = self.parser.get_matching_content(empty_data)
+        result = parser.get_matching_content(empty_data)
         assert result == ''
     
-    def test_get_matching_content_only_tags(self):
+    def test_get_matching_content_only_tags(self, parser):
         """Test getting matching content with only tags."""
         data = {
             'metadata': {
@@ -251,10 +296,10 @@ template:
             },
             'template': {}
         }
-        result = self.parser.get_matching_content(data)
+        result = parser.get_matching_content(data)
         assert result == 'tag1 tag2'
     
-    def test_get_matching_content_only_notes(self):
+    def test_get_matching_content_only_notes(self, parser):
         """Test getting matching content with only notes."""
         data = {
             'metadata': {
@@ -262,10 +307,10 @@ template:
             },
             'template': {}
         }
-        result = self.parser.get_matching_content(data)
+        result = parser.get_matching_content(data)
         assert result == 'Important notes here'
     
-    def test_get_matching_content_only_subject(self):
+    def test_get_matching_content_only_subject(self, parser):
         """Test getting matching content with only subject."""
         data = {
             'metadata': {},
@@ -273,10 +318,10 @@ template:
                 'subject': 'Important Subject'
             }
         }
-        result = self.parser.get_matching_content(data)
+        result = parser.get_matching_content(data)
         assert result == 'Subject: Important Subject'
     
-    def test_get_matching_content_only_content(self):
+    def test_get_matching_content_only_content(self, parser):
         """Test getting matching content with only content."""
         data = {
             'metadata': {},
@@ -284,5 +329,5 @@ template:
                 'content': 'Important content here'
             }
         }
-        result = self.parser.get_matching_content(data)
+        result = parser.get_matching_content(data)
         assert result == 'Important content here' 
\ No newline at end of file
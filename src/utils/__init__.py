@@ -5,7 +5,7 @@ This package contains shared utilities and helper functions used across the Hedw
 """
 
 # Import utilities as they are created
-from .logging_utils import log, log_error, log_warning, log_info, log_debug, log_success
+from .logging_utils import log, log_enabled, set_log_enabled, set_log_level, log_error, log_warning, log_info, log_debug, log_success
 from .text_utils import TextProcessor
 from .file_utils import FileUtils
 from .error_utils import ErrorHandler, safe_operation, retry_operation_decorator
@@ -17,6 +17,9 @@ __author__ = "Hedwig Team"
 # Export all utility classes and functions
 __all__ = [
     "log",
+    "log_enabled",
+    "set_log_enabled",
+    "set_log_level",
     "log_error",
     "log_warning", 
     "log_info",
@@ -6,15 +6,56 @@ for environment variables, config files, and runtime configuration management.
 """
 
 import os
+import re
 import json
-from typing import Dict, Any, List, Optional, Union
+import functools
+from typing import Dict, Any, FrozenSet, List, Optional, Set, Tuple, Union
 from pathlib import Path
-from dotenv import load_dotenv
 
-from .logging_utils import log
+from .logging_utils import log, log_enabled, ERROR, WARNING
 from .file_utils import FileUtils
 from .error_utils import ErrorHandler
 
+# orjson parses straight from bytes and is much faster; stdlib json is the fallback
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Marks a key that is absent, so a stored None is still returned as-is
+_MISSING = object()
+
+
+# Key substrings whose values are masked by default
+_DEFAULT_SENSITIVE_KEYS: FrozenSet[str] = frozenset({'api_key', 'password', 'secret', 'token'})
+
+# Sensitive values too short to reveal any characters of
+_MASKED_SHORT_VALUE = "***"
+
+
+@functools.lru_cache(maxsize=32)
+def _sensitive_key_pattern(sensitive_keys: FrozenSet[str]) -> re.Pattern:
+    """Compile one alternation matching any of the sensitive key substrings."""
+    return re.compile('|'.join(map(re.escape, sensitive_keys)), re.IGNORECASE)
+
+
+# .env files already loaded by load_environment_variables; the default lookup uses a marker key
+_DOTENV_LOADED: Set[str] = set()
+_DEFAULT_ENV_FILE_KEY = "<default>"
+
+
+def load_dotenv(*args, **kwargs) -> bool:
+    """Load a .env file, importing python-dotenv only when it is first needed."""
+    from dotenv import load_dotenv as _load_dotenv
+    return _load_dotenv(*args, **kwargs)
+
+
+@functools.lru_cache(maxsize=512)
+def _split_key_path(key_path: str) -> Tuple[str, ...]:
+    """Split a dot-separated config key path, caching the result per path."""
+    return tuple(key_path.split('.'))
+
 
 class ConfigUtils:
     """
@@ -32,14 +73,20 @@ class ConfigUtils:
         Args:
             env_file: Path to .env file (default: auto-detect)
         """
+        # Each .env file only needs loading once per process
+        loaded_key = env_file or _DEFAULT_ENV_FILE_KEY
+        if loaded_key in _DOTENV_LOADED:
+            return
+        
         try:
             if env_file:
                 load_dotenv(env_file)
             else:
                 load_dotenv()
+            _DOTENV_LOADED.add(loaded_key)
             log("Environment variables loaded successfully", prefix="ConfigUtils")
         except Exception as e:
-            log(f"WARNING: Failed to load environment variables: {e}", prefix="ConfigUtils")
+            log(f"WARNING: Failed to load environment variables: {e}", prefix="ConfigUtils", level=WARNING)
     
     @staticmethod
     def get_env_variables(keys: List[str]) -> Dict[str, Any]:
@@ -52,12 +99,12 @@ class ConfigUtils:
         Returns:
             Dictionary of key-value pairs for found environment variables
         """
-        env_vars = {}
-        for key in keys:
-            value = os.getenv(key)
-            if value is not None:
-                env_vars[key] = value
-                log(f"Loaded env var: {key} = {ConfigUtils._mask_sensitive_value(key, value)}", prefix="ConfigUtils")
+        # One environ lookup per key; an empty string is still a set variable
+        environ = os.environ
+        env_vars = {key: value for key in keys if (value := environ.get(key)) is not None}
+        if env_vars and log_enabled():
+            loaded = ', '.join(f"{key} = {ConfigUtils._mask_sensitive_value(key, value)}" for key, value in env_vars.items())
+            log(f"Loaded {len(env_vars)} env vars: {loaded}", prefix="ConfigUtils")
         
         return env_vars
     
@@ -76,27 +123,26 @@ class ConfigUtils:
         if supported_formats is None:
             supported_formats = ['.json']
         
-        config_path = Path(config_file)
-        
         # Validate file exists and is readable
-        if not FileUtils.validate_file_exists(config_path):
-            log(f"WARNING: Config file not found or not readable: {config_file}", prefix="ConfigUtils")
+        if not FileUtils.validate_file_exists(config_file):
+            log(f"WARNING: Config file not found or not readable: {config_file}", prefix="ConfigUtils", level=WARNING)
             return None
         
         # Check file format
-        if not any(config_file.endswith(fmt) for fmt in supported_formats):
-            log(f"WARNING: Unsupported config file format: {config_file}", prefix="ConfigUtils")
+        if not config_file.endswith(tuple(supported_formats)):
+            log(f"WARNING: Unsupported config file format: {config_file}", prefix="ConfigUtils", level=WARNING)
             return None
         
-        # Read file content using FileUtils
-        content = FileUtils.safe_read_file(config_path)
+        # Read the raw bytes in one call; both parsers accept bytes, so no decoded copy is made
+        content = ErrorHandler.handle_file_operation(Path(config_file).read_bytes)
         if content is None:
-            log(f"WARNING: Failed to read config file: {config_file}", prefix="ConfigUtils")
+            log(f"WARNING: Failed to read config file: {config_file}", prefix="ConfigUtils", level=WARNING)
             return None
         
         def parse_config():
             if config_file.endswith('.json'):
-                data = json.loads(content)
+                # orjson.JSONDecodeError subclasses ValueError, so failures still return None
+                data = orjson.loads(content) if ORJSON_AVAILABLE else json.loads(content)
             else:
                 raise ValueError(f"Unsupported config file format: {config_file}")
             
@@ -120,22 +166,19 @@ class ConfigUtils:
         Returns:
             Merged configuration dictionary
         """
-        config = defaults.copy()
-        
-        # Apply environment variables (override defaults)
-        config.update(env_vars)
+        file_config = file_config or {}
         
-        # Apply file config (override env and defaults)
-        if file_config:
-            config.update(file_config)
+        # Later sources override earlier ones: file > env > defaults
+        config = {**defaults, **env_vars, **file_config}
         
-        log(f"Merged config from {len(defaults)} defaults, {len(env_vars)} env vars, {len(file_config or {})} file values", prefix="ConfigUtils")
+        log(f"Merged config from {len(defaults)} defaults, {len(env_vars)} env vars, {len(file_config)} file values", prefix="ConfigUtils")
         return config
     
     @staticmethod
     def validate_config(config: Dict[str, Any], 
                        required_keys: List[str], 
-                       optional_keys: List[str] = None) -> bool:
+                       optional_keys: List[str] = None,
+                       fast_fail: bool = False) -> bool:
         """
         Validate configuration against required and optional keys.
         
@@ -143,6 +186,7 @@ class ConfigUtils:
             config: Configuration dictionary to validate
             required_keys: List of keys that must be present and non-empty
             optional_keys: List of keys that are optional (default: None)
+            fast_fail: Stop at the first missing required key instead of reporting all of them
             
         Returns:
             True if configuration is valid, False otherwise
@@ -150,21 +194,21 @@ class ConfigUtils:
         if optional_keys is None:
             optional_keys = []
         
-        # Check required keys
-        missing_keys = []
-        for key in required_keys:
-            if key not in config or not config[key]:
-                missing_keys.append(key)
+        # Check required keys; one lookup covers both absent and empty values
+        if fast_fail:
+            missing_keys = next(([key] for key in required_keys if not config.get(key)), [])
+        else:
+            missing_keys = [key for key in required_keys if not config.get(key)]
         
         if missing_keys:
-            log(f"ERROR: Missing required config keys: {missing_keys}", prefix="ConfigUtils")
+            log(f"ERROR: Missing required config keys: {missing_keys}", prefix="ConfigUtils", level=ERROR)
             return False
         
         # Check for unknown keys (optional validation)
-        all_valid_keys = set(required_keys) | set(optional_keys)
-        unknown_keys = set(config.keys()) - all_valid_keys
+        all_valid_keys = frozenset(required_keys).union(optional_keys)
+        unknown_keys = config.keys() - all_valid_keys
         if unknown_keys:
-            log(f"WARNING: Unknown config keys found: {unknown_keys}", prefix="ConfigUtils")
+            log(f"WARNING: Unknown config keys found: {unknown_keys}", prefix="ConfigUtils", level=WARNING)
         
         log(f"Configuration validation passed: {len(required_keys)} required, {len(optional_keys)} optional", prefix="ConfigUtils")
         return True
@@ -182,15 +226,20 @@ class ConfigUtils:
         Returns:
             Configuration value or default
         """
-        keys = key_path.split('.')
+        # Most lookups are a single top-level key
+        if '.' not in key_path:
+            return config.get(key_path, default) if isinstance(config, dict) else default
+        
         current = config
         
-        try:
-            for key in keys:
-                current = current[key]
-            return current
-        except (KeyError, TypeError):
-            return default
+        # One dict.get per level; a non-dict in the middle of the path means not found
+        for key in _split_key_path(key_path):
+            if not isinstance(current, dict):
+                return default
+            current = current.get(key, _MISSING)
+            if current is _MISSING:
+                return default
+        return current
     
     @staticmethod
     def set_nested_config(config: Dict[str, Any], key_path: str, value: Any) -> bool:
@@ -205,22 +254,23 @@ class ConfigUtils:
         Returns:
             True if successful, False otherwise
         """
-        keys = key_path.split('.')
+        keys = _split_key_path(key_path) if '.' in key_path else (key_path,)
         current = config
         
         try:
-            # Navigate to the parent of the target key
+            # Navigate to the parent of the target key, creating missing levels
             for key in keys[:-1]:
-                if key not in current:
-                    current[key] = {}
-                current = current[key]
+                current = current.setdefault(key, {})
+                if not isinstance(current, dict):
+                    raise TypeError(f"'{key}' holds a {type(current).__name__}, not a config section")
             
             # Set the value
             current[keys[-1]] = value
-            log(f"Set nested config: {key_path} = {ConfigUtils._mask_sensitive_value(key_path, value)}", prefix="ConfigUtils")
+            if log_enabled():
+                log(f"Set nested config: {key_path} = {ConfigUtils._mask_sensitive_value(key_path, value)}", prefix="ConfigUtils")
             return True
         except Exception as e:
-            log(f"ERROR: Failed to set nested config {key_path}: {e}", prefix="ConfigUtils")
+            log(f"ERROR: Failed to set nested config {key_path}: {e}", prefix="ConfigUtils", level=ERROR)
             return False
     
     @staticmethod
@@ -236,13 +286,16 @@ class ConfigUtils:
         Returns:
             Configuration dictionary with sensitive values masked
         """
-        if sensitive_keys is None:
-            sensitive_keys = ['api_key', 'password', 'secret', 'token']
+        sensitive_keys = _DEFAULT_SENSITIVE_KEYS if sensitive_keys is None else frozenset(sensitive_keys)
         
         masked_config = config.copy()
+        if not sensitive_keys:
+            return masked_config
         
+        # A single case-insensitive regex scan per key instead of one substring test per sensitive key
+        sensitive_pattern = _sensitive_key_pattern(sensitive_keys)
         for key, value in masked_config.items():
-            if any(sensitive in key.lower() for sensitive in sensitive_keys):
+            if sensitive_pattern.search(key):
                 masked_config[key] = ConfigUtils._mask_sensitive_value(key, value)
         
         return masked_config
@@ -254,15 +307,11 @@ class ConfigUtils:
             return str(value)
         
         if len(value) < 8:
-            return "***"
+            return _MASKED_SHORT_VALUE
         
-        # Different masking patterns based on key type
-        if 'api_key' in key.lower():
-            # API keys: first 4 + ... + last 4
-            return value[:4] + "..." + value[-4:]
-        else:
-            # Passwords and other secrets: first 4 + ... + last 3
-            return value[:4] + "..." + value[-3:]
+        # API keys keep the last 4 characters, passwords and other secrets the last 3
+        tail_length = 4 if 'api_key' in key.lower() else 3
+        return "".join((value[:4], "...", value[-tail_length:]))
     
     @staticmethod
     def export_config(config: Dict[str, Any], 
@@ -278,12 +327,25 @@ class ConfigUtils:
             
         Returns:
             True if export successful, False otherwise
+            
+        Note:
+            With orjson installed, JSON exports write non-ASCII characters as UTF-8
+            rather than \\u escapes. Configs orjson cannot encode, such as integers
+            wider than 64 bits, are written with the stdlib json module instead.
         """
         def export_operation():
+            # Build the whole document up front so it is written in one call
             if format == 'json':
-                content = json.dumps(config, indent=2)
+                content = None
+                if ORJSON_AVAILABLE:
+                    try:
+                        content = orjson.dumps(config, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode('utf-8')
+                    except orjson.JSONEncodeError:
+                        pass
+                if content is None:
+                    content = json.dumps(config, indent=2)
             elif format == 'env':
-                content = '\n'.join([f"{key}={value}" for key, value in config.items()])
+                content = ''.join(f"{key}={value}\n" for key, value in config.items())
             else:
                 raise ValueError(f"Unsupported export format: {format}")
             
@@ -293,6 +355,6 @@ class ConfigUtils:
         if success:
             log(f"Configuration exported to {output_file} in {format} format", prefix="ConfigUtils")
         else:
-            log(f"ERROR: Failed to export configuration to {output_file}", prefix="ConfigUtils")
+            log(f"ERROR: Failed to export configuration to {output_file}", prefix="ConfigUtils", level=ERROR)
         
         return bool(success) 
\ No newline at end of file
@@ -5,12 +5,59 @@ This module provides standardized error handling patterns for file operations,
 API calls, configuration operations, and general error formatting.
 """
 
-from typing import Any, Callable, Optional, TypeVar, Union
+import random
+import time
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar, Union
 from functools import wraps
-from .logging_utils import log
+from .logging_utils import log, ERROR
 
 T = TypeVar('T')
 
+# Expected failures per operation kind and how each is reported, checked in order
+_FILE_OPERATION_ERRORS = (
+    (FileNotFoundError, "File not found"),
+    (PermissionError, "Permission denied"),
+    (UnicodeDecodeError, "Encoding error"),
+)
+_API_OPERATION_ERRORS = (
+    (ConnectionError, "Connection error during API operation"),
+    (TimeoutError, "Timeout during API operation"),
+    (ValueError, "Invalid value in API operation"),
+)
+_CONFIG_OPERATION_ERRORS = (
+    (KeyError, "Missing configuration key"),
+    (ValueError, "Invalid configuration value"),
+)
+
+# Transient failures that retry_operation retries; anything else fails immediately
+_RETRYABLE_ERRORS = (ConnectionError, TimeoutError)
+
+
+def _run_operation(operation: Callable[..., T], args: Tuple[Any, ...], kwargs: Dict[str, Any],
+                   kind: str, error_messages: Tuple[Tuple[type, str], ...]) -> Optional[T]:
+    """
+    Run an operation and log its failure instead of raising.
+    
+    Args:
+        operation: The operation function to execute
+        args: Positional arguments to pass to the operation
+        kwargs: Keyword arguments to pass to the operation
+        kind: Operation kind used in the message for unexpected errors
+        error_messages: (exception type, message) pairs for expected failures
+        
+    Returns:
+        Result of the operation, or None if it fails
+    """
+    try:
+        return operation(*args, **kwargs)
+    except Exception as e:
+        message = next(
+            (message for error_type, message in error_messages if isinstance(e, error_type)),
+            f"Unexpected {kind} operation error"
+        )
+        log(f"ERROR: {message}: {e}", prefix="ErrorHandler", level=ERROR)
+        return None
+
 
 class ErrorHandler:
     """
@@ -33,21 +80,7 @@ class ErrorHandler:
         Returns:
             Result of the operation, or None if it fails
         """
-        try:
-            result = operation(*args, **kwargs)
-            return result
-        except FileNotFoundError as e:
-            log(f"ERROR: File not found: {e}", prefix="ErrorHandler")
-            return None
-        except PermissionError as e:
-            log(f"ERROR: Permission denied: {e}", prefix="ErrorHandler")
-            return None
-        except UnicodeDecodeError as e:
-            log(f"ERROR: Encoding error: {e}", prefix="ErrorHandler")
-            return None
-        except Exception as e:
-            log(f"ERROR: Unexpected file operation error: {e}", prefix="ErrorHandler")
-            return None
+        return _run_operation(operation, args, kwargs, "file", _FILE_OPERATION_ERRORS)
     
     @staticmethod
     def handle_api_operation(operation: Callable[..., T], *args, **kwargs) -> Optional[T]:
@@ -62,21 +95,7 @@ class ErrorHandler:
         Returns:
             Result of the operation, or None if it fails
         """
-        try:
-            result = operation(*args, **kwargs)
-            return result
-        except ConnectionError as e:
-            log(f"ERROR: Connection error during API operation: {e}", prefix="ErrorHandler")
-            return None
-        except TimeoutError as e:
-            log(f"ERROR: Timeout during API operation: {e}", prefix="ErrorHandler")
-            return None
-        except ValueError as e:
-            log(f"ERROR: Invalid value in API operation: {e}", prefix="ErrorHandler")
-            return None
-        except Exception as e:
-            log(f"ERROR: Unexpected API operation error: {e}", prefix="ErrorHandler")
-            return None
+        return _run_operation(operation, args, kwargs, "API", _API_OPERATION_ERRORS)
     
     @staticmethod
     def handle_config_operation(operation: Callable[..., T], *args, **kwargs) -> Optional[T]:
@@ -91,18 +110,7 @@ class ErrorHandler:
         Returns:
             Result of the operation, or None if it fails
         """
-        try:
-            result = operation(*args, **kwargs)
-            return result
-        except KeyError as e:
-            log(f"ERROR: Missing configuration key: {e}", prefix="ErrorHandler")
-            return None
-        except ValueError as e:
-            log(f"ERROR: Invalid configuration value: {e}", prefix="ErrorHandler")
-            return None
-        except Exception as e:
-            log(f"ERROR: Unexpected configuration operation error: {e}", prefix="ErrorHandler")
-            return None
+        return _run_operation(operation, args, kwargs, "configuration", _CONFIG_OPERATION_ERRORS)
     
     @staticmethod
     def format_error_message(error: Exception, context: str = "") -> str:
@@ -117,18 +125,18 @@ class ErrorHandler:
             Formatted error message string
         """
         error_type = type(error).__name__
-        error_msg = str(error)
         
         if context:
-            return f"{context}: {error_type} - {error_msg}"
-        else:
-            return f"{error_type}: {error_msg}"
+            return "%s: %s - %s" % (context, error_type, error)
+        return "%s: %s" % (error_type, error)
     
     @staticmethod
     def safe_execute(operation: Callable[..., T], 
                     error_context: str = "",
                     default_value: Optional[T] = None,
-                    log_errors: bool = True) -> Optional[T]:
+                    log_errors: bool = True,
+                    args: Tuple[Any, ...] = (),
+                    kwargs: Optional[Dict[str, Any]] = None) -> Optional[T]:
         """
         Generic safe execution wrapper for any operation.
         
@@ -137,65 +145,80 @@ class ErrorHandler:
             error_context: Context for error logging
             default_value: Value to return if operation fails
             log_errors: Whether to log errors (default: True)
+            args: Positional arguments to pass to the operation
+            kwargs: Keyword arguments to pass to the operation
             
         Returns:
             Result of the operation, or default_value if it fails
         """
         try:
-            result = operation()
+            result = operation(*args, **(kwargs or {}))
             return result
         except Exception as e:
             if log_errors:
                 formatted_error = ErrorHandler.format_error_message(e, error_context)
-                log(f"ERROR: {formatted_error}", prefix="ErrorHandler")
+                log(f"ERROR: {formatted_error}", prefix="ErrorHandler", level=ERROR)
             return default_value
     
     @staticmethod
     def retry_operation(operation: Callable[..., T],
                        max_retries: int = 3,
                        error_context: str = "",
-                       retry_delay: float = 1.0) -> Optional[T]:
+                       retry_delay: float = 1.0,
+                       max_retry_delay: float = 30.0,
+                       jitter: float = 0.0,
+                       args: Tuple[Any, ...] = (),
+                       kwargs: Optional[Dict[str, Any]] = None) -> Optional[T]:
         """
         Execute an operation with retry logic for transient failures.
         
+        The delay doubles after each failed attempt, up to max_retry_delay.
+        
         Args:
             operation: The operation function to execute
             max_retries: Maximum number of retry attempts
             error_context: Context for error logging
-            retry_delay: Delay between retries in seconds
+            retry_delay: Delay before the first retry in seconds
+            max_retry_delay: Upper bound for the backoff delay in seconds
+            jitter: Maximum random seconds added to each delay to spread out concurrent callers
+            args: Positional arguments to pass to the operation on every attempt
+            kwargs: Keyword arguments to pass to the operation on every attempt
             
         Returns:
             Result of the operation, or None if all retries fail
         """
-        import time
-        
+        kwargs = kwargs or {}
         for attempt in range(max_retries + 1):
             try:
-                result = operation()
+                result = operation(*args, **kwargs)
                 if attempt > 0:
                     log(f"Operation succeeded on attempt {attempt + 1}", prefix="ErrorHandler")
                 return result
-            except (ConnectionError, TimeoutError) as e:
+            except _RETRYABLE_ERRORS as e:
                 if attempt < max_retries:
                     log(f"Retry {attempt + 1}/{max_retries} after {error_context}: {e}", prefix="ErrorHandler")
-                    time.sleep(retry_delay)
+                    delay = min(max_retry_delay, retry_delay * 2 ** attempt)
+                    if jitter:
+                        delay += random.uniform(0, jitter)
+                    time.sleep(delay)
                 else:
-                    log(f"ERROR: Operation failed after {max_retries + 1} attempts: {error_context}: {e}", prefix="ErrorHandler")
+                    log(f"ERROR: Operation failed after {max_retries + 1} attempts: {error_context}: {e}", prefix="ErrorHandler", level=ERROR)
                     return None
             except Exception as e:
-                log(f"ERROR: Non-retryable error in {error_context}: {e}", prefix="ErrorHandler")
+                log(f"ERROR: Non-retryable error in {error_context}: {e}", prefix="ErrorHandler", level=ERROR)
                 return None
         
         return None
 
 
-def safe_operation(error_context: str = "", default_value: Any = None):
+def safe_operation(error_context: str = "", default_value: Any = None, log_errors: bool = True):
     """
     Decorator for safe operation execution with error handling.
     
     Args:
         error_context: Context for error logging
         default_value: Value to return if operation fails
+        log_errors: Whether to log errors (default: True)
         
     Returns:
         Decorated function that handles errors safely
@@ -203,23 +226,30 @@ def safe_operation(error_context: str = "", default_value: Any = None):
     def decorator(func: Callable[..., T]) -> Callable[..., Optional[T]]:
         @wraps(func)
         def wrapper(*args, **kwargs) -> Optional[T]:
+            # Pass the call arguments through rather than wrapping them in a lambda
             return ErrorHandler.safe_execute(
-                lambda: func(*args, **kwargs),
+                func,
                 error_context=error_context,
-                default_value=default_value
+                default_value=default_value,
+                log_errors=log_errors,
+                args=args,
+                kwargs=kwargs
             )
         return wrapper
     return decorator
 
 
-def retry_operation_decorator(max_retries: int = 3, error_context: str = "", retry_delay: float = 1.0):
+def retry_operation_decorator(max_retries: int = 3, error_context: str = "", retry_delay: float = 1.0,
+                              max_retry_delay: float = 30.0, jitter: float = 0.0):
     """
     Decorator for operation execution with retry logic.
     
     Args:
         max_retries: Maximum number of retry attempts
         error_context: Context for error logging
-        retry_delay: Delay between retries in seconds
+        retry_delay: Delay before the first retry in seconds
+        max_retry_delay: Upper bound for the backoff delay in seconds
+        jitter: Maximum random seconds added to each delay
         
     Returns:
         Decorated function that retries on failure
@@ -227,11 +257,16 @@ def retry_operation_decorator(max_retries: int = 3, error_context: str = "", ret
     def decorator(func: Callable[..., T]) -> Callable[..., Optional[T]]:
         @wraps(func)
         def wrapper(*args, **kwargs) -> Optional[T]:
+            # Pass the call arguments through rather than wrapping them in a lambda
             return ErrorHandler.retry_operation(
-                lambda: func(*args, **kwargs),
+                func,
                 max_retries=max_retries,
                 error_context=error_context,
-                retry_delay=retry_delay
+                retry_delay=retry_delay,
+                max_retry_delay=max_retry_delay,
+                jitter=jitter,
+                args=args,
+                kwargs=kwargs
             )
         return wrapper
     return decorator 
\ No newline at end of file
@@ -5,10 +5,29 @@ This module provides standardized file operations including safe file reading,
 writing, YAML frontmatter parsing, and file discovery utilities.
 """
 
+import copy
+import functools
+import os
+import stat
 import yaml
 from pathlib import Path
-from typing import Dict, Any, List, Tuple, Optional
-from .logging_utils import log
+from typing import Dict, Any, List, Tuple, Optional, Union
+from .logging_utils import log, ERROR, WARNING
+
+# Prefer the libyaml-backed loader; fall back to pure Python when libyaml is missing
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
+# Larger than io.DEFAULT_BUFFER_SIZE so big outputs go out in fewer write calls
+WRITE_BUFFER_SIZE = 128 * 1024
+
+
+@functools.lru_cache(maxsize=256)
+def _load_frontmatter(frontmatter_text: str) -> Dict[str, Any]:
+    """Parse a frontmatter block once per distinct text; YAML errors propagate uncached."""
+    return yaml.load(frontmatter_text, Loader=_SafeLoader) or {}
 
 
 class FileUtils:
@@ -32,21 +51,20 @@ class FileUtils:
             File content as string, or None if reading fails
         """
         try:
-            with open(file_path, 'r', encoding=encoding) as f:
-                content = f.read()
+            content = Path(file_path).read_text(encoding=encoding)
             log(f"Successfully read file: {file_path}")
             return content
         except FileNotFoundError:
-            log(f"ERROR: File not found: {file_path}", prefix="FileUtils")
+            log(f"ERROR: File not found: {file_path}", prefix="FileUtils", level=ERROR)
             return None
         except PermissionError:
-            log(f"ERROR: Permission denied reading file: {file_path}", prefix="FileUtils")
+            log(f"ERROR: Permission denied reading file: {file_path}", prefix="FileUtils", level=ERROR)
             return None
         except UnicodeDecodeError as e:
-            log(f"ERROR: Encoding error reading file {file_path}: {e}", prefix="FileUtils")
+            log(f"ERROR: Encoding error reading file {file_path}: {e}", prefix="FileUtils", level=ERROR)
             return None
         except Exception as e:
-            log(f"ERROR: Unexpected error reading file {file_path}: {e}", prefix="FileUtils")
+            log(f"ERROR: Unexpected error reading file {file_path}: {e}", prefix="FileUtils", level=ERROR)
             return None
     
     @staticmethod
@@ -63,18 +81,22 @@ class FileUtils:
             True if writing succeeds, False otherwise
         """
         try:
-            # Ensure directory exists
-            file_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            with open(file_path, 'w', encoding=encoding) as f:
+            # Open first and only create the parent directory when it is missing,
+            # so writes into an existing directory skip the mkdir syscall
+            try:
+                f = open(file_path, 'w', encoding=encoding, buffering=WRITE_BUFFER_SIZE)
+            except FileNotFoundError:
+                file_path.parent.mkdir(parents=True, exist_ok=True)
+                f = open(file_path, 'w', encoding=encoding, buffering=WRITE_BUFFER_SIZE)
+            with f:
                 f.write(content)
             log(f"Successfully wrote file: {file_path}")
             return True
         except PermissionError:
-            log(f"ERROR: Permission denied writing file: {file_path}", prefix="FileUtils")
+            log(f"ERROR: Permission denied writing file: {file_path}", prefix="FileUtils", level=ERROR)
             return False
         except Exception as e:
-            log(f"ERROR: Unexpected error writing file {file_path}: {e}", prefix="FileUtils")
+            log(f"ERROR: Unexpected error writing file {file_path}: {e}", prefix="FileUtils", level=ERROR)
             return False
     
     @staticmethod
@@ -91,18 +113,37 @@ class FileUtils:
         """
         try:
             if not directory.exists():
-                log(f"WARNING: Directory does not exist: {directory}", prefix="FileUtils")
+                log(f"WARNING: Directory does not exist: {directory}", prefix="FileUtils", level=WARNING)
                 return []
             
             if not directory.is_dir():
-                log(f"WARNING: Path is not a directory: {directory}", prefix="FileUtils")
+                log(f"WARNING: Path is not a directory: {directory}", prefix="FileUtils", level=WARNING)
                 return []
             
-            files = list(directory.rglob(f"*{extension}"))
+            # Walk with os.scandir: directory entries carry their type, so there is
+            # no extra stat per entry and only matches are turned into Path objects.
+            # Files come out like rglob's: a directory's matches, then its subdirectories
+            files = []
+            pending = [str(directory)]
+            while pending:
+                subdirectories = []
+                current = pending.pop()
+                try:
+                    with os.scandir(current) as entries:
+                        for entry in entries:
+                            if entry.is_dir(follow_symlinks=False):
+                                subdirectories.append(entry.path)
+                            elif entry.name.endswith(extension):
+                                files.append(Path(entry.path))
+                except (PermissionError, FileNotFoundError) as e:
+                    # Like rglob, skip a directory that can't be listed (or vanished) and keep walking
+                    log(f"WARNING: Skipping unreadable directory {current}: {e}", prefix="FileUtils", level=WARNING)
+                    continue
+                pending.extend(reversed(subdirectories))
             log(f"Found {len(files)} files with extension '{extension}' in {directory}", prefix="FileUtils")
             return files
         except Exception as e:
-            log(f"ERROR: Unexpected error searching directory {directory}: {e}", prefix="FileUtils")
+            log(f"ERROR: Unexpected error searching directory {directory}: {e}", prefix="FileUtils", level=ERROR)
             return []
     
     @staticmethod
@@ -116,44 +157,50 @@ class FileUtils:
         Returns:
             Tuple of (metadata, content) where metadata is a dict and content is the remaining text
         """
-        lines = content.split('\n')
-        
-        # Check if content starts with frontmatter
-        if not lines or not lines[0].strip().startswith('---'):
+        # Check if content starts with frontmatter, looking only at the first line
+        first_line_end = content.find('\n')
+        first_line = content if first_line_end == -1 else content[:first_line_end]
+        if not first_line.strip().startswith('---'):
             return {}, content
         
-        # Find frontmatter boundaries
-        start_idx = 0
-        end_idx = None
-        
-        for i, line in enumerate(lines[1:], 1):
-            if line.strip() == '---':
-                end_idx = i
+        # Find the closing marker line by jumping between '---' occurrences rather
+        # than splitting the whole document into lines
+        end_line_start = None
+        search_from = first_line_end + 1
+        while first_line_end != -1:
+            marker = content.find('---', search_from)
+            if marker == -1:
+                break
+            line_start = content.rfind('\n', 0, marker) + 1
+            line_end = content.find('\n', marker)
+            if line_end == -1:
+                line_end = len(content)
+            if content[line_start:line_end].strip() == '---':
+                end_line_start = line_start
                 break
+            search_from = line_end
         
-        if end_idx is None:
-            log("WARNING: Frontmatter start marker found but no end marker", prefix="FileUtils")
+        if end_line_start is None:
+            log("WARNING: Frontmatter start marker found but no end marker", prefix="FileUtils", level=WARNING)
             return {}, content
         
         # Extract and parse frontmatter
-        frontmatter_lines = lines[1:end_idx]
-        frontmatter_text = '\n'.join(frontmatter_lines)
+        frontmatter_text = content[first_line_end + 1:end_line_start - 1]
         
         try:
-            metadata = yaml.safe_load(frontmatter_text) or {}
+            # Only the small frontmatter block is cached, not the whole document;
+            # callers get their own copy of the metadata to mutate
+            metadata = copy.deepcopy(_load_frontmatter(frontmatter_text))
             log(f"Successfully parsed YAML frontmatter with {len(metadata)} fields", prefix="FileUtils")
         except yaml.YAMLError as e:
-            log(f"ERROR parsing YAML frontmatter: {e}", prefix="FileUtils")
+            log(f"ERROR parsing YAML frontmatter: {e}", prefix="FileUtils", level=ERROR)
             metadata = {}
         
         # Extract content after frontmatter
-        content_lines = lines[end_idx + 1:]
-        content = '\n'.join(content_lines)
-        
-        return metadata, content
+        return metadata, content[line_end + 1:]
     
     @staticmethod
-    def validate_file_exists(file_path: Path) -> bool:
+    def validate_file_exists(file_path: Union[str, Path]) -> bool:
         """
         Validate that a file exists and is readable.
         
@@ -164,21 +211,25 @@ class FileUtils:
             True if file exists and is readable, False otherwise
         """
         try:
-            if not file_path.exists():
+            # One stat answers both "exists" and "is a regular file"
+            try:
+                file_stat = os.stat(file_path)
+            except FileNotFoundError:
                 log(f"File does not exist: {file_path}", prefix="FileUtils")
                 return False
             
-            if not file_path.is_file():
+            if not stat.S_ISREG(file_stat.st_mode):
                 log(f"Path is not a file: {file_path}", prefix="FileUtils")
                 return False
             
-            # Test if file is readable
-            with open(file_path, 'r') as f:
-                f.read(1)  # Read one character to test readability
+            # Check read permission without opening the file
+            if not os.access(file_path, os.R_OK):
+                log(f"File is not readable: {file_path}", prefix="FileUtils")
+                return False
             
             return True
         except Exception as e:
-            log(f"ERROR validating file {file_path}: {e}", prefix="FileUtils")
+            log(f"ERROR validating file {file_path}: {e}", prefix="FileUtils", level=ERROR)
             return False
     
     @staticmethod
@@ -195,7 +246,7 @@ class FileUtils:
         try:
             return file_path.stat().st_size
         except Exception as e:
-            log(f"ERROR getting file size for {file_path}: {e}", prefix="FileUtils")
+            log(f"ERROR getting file size for {file_path}: {e}", prefix="FileUtils", level=ERROR)
             return None
     
     @staticmethod
@@ -214,5 +265,5 @@ class FileUtils:
             log(f"Directory ready: {directory}", prefix="FileUtils")
             return True
         except Exception as e:
-            log(f"ERROR creating directory {directory}: {e}", prefix="FileUtils")
+            log(f"ERROR creating directory {directory}: {e}", prefix="FileUtils", level=ERROR)
             return False 
\ No newline at end of file
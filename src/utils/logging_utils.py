@@ -4,17 +4,77 @@ Logging utilities for Hedwig.
 This module provides standardized logging functions for consistent logging across the application.
 """
 
+import os
 import sys
-from typing import Optional
+from typing import Optional, Union
 
+# Severity of each log function; messages below the threshold are dropped before formatting
+DEBUG = 10
+INFO = 20
+SUCCESS = 25
+WARNING = 30
+ERROR = 40
+_LEVEL_NAMES = {"DEBUG": DEBUG, "INFO": INFO, "SUCCESS": SUCCESS, "WARNING": WARNING, "ERROR": ERROR}
 
-def log(msg: str, prefix: str = "Hedwig") -> None:
-    """Log a message with the specified prefix."""
-    print(f"[{prefix}] {msg}")
+
+def _parse_level(level: Union[int, str]) -> int:
+    """Turn a level name (e.g. 'WARNING') or number into its numeric threshold."""
+    if isinstance(level, str) and not level.strip().lstrip('-').isdigit():
+        return _LEVEL_NAMES[level.strip().upper()]
+    return int(level)
+
+
+def _env_log_level() -> int:
+    """Read HEDWIG_LOG_LEVEL, falling back to DEBUG when it is unset, empty or not a level."""
+    value = os.environ.get("HEDWIG_LOG_LEVEL", "").strip()
+    if not value:
+        return DEBUG
+    try:
+        return _parse_level(value)
+    except (KeyError, ValueError):
+        print(f"[Hedwig] WARNING: Unknown HEDWIG_LOG_LEVEL {value!r}, logging everything")
+        return DEBUG
+
+
+# Everything is printed by default; set HEDWIG_LOG_LEVEL (e.g. WARNING or 30) to quiet output
+_LOG_LEVEL = _env_log_level()
+
+# Master switch for all log output; callers building costly messages can check log_enabled() first
+_LOG_ENABLED = True
+
+
+def set_log_enabled(enabled: bool) -> None:
+    """Turn all log output on or off."""
+    global _LOG_ENABLED
+    _LOG_ENABLED = enabled
+
+
+def set_log_level(level: Union[int, str]) -> None:
+    """Set the minimum level that is printed, by name or number."""
+    global _LOG_LEVEL
+    _LOG_LEVEL = _parse_level(level)
+
+
+def _should_log(level: int) -> bool:
+    """The one gate every log function goes through."""
+    return _LOG_ENABLED and level >= _LOG_LEVEL
+
+
+def log_enabled(level: int = INFO) -> bool:
+    """Return whether a message at this level would be printed, so callers can skip building it."""
+    return _should_log(level)
+
+
+def log(msg: str, prefix: str = "Hedwig", level: int = INFO) -> None:
+    """Log a message with the specified prefix at the given level."""
+    if _should_log(level):
+        print(f"[{prefix}] {msg}")
 
 
 def log_error(msg: str, prefix: str = "Hedwig", exception: Optional[Exception] = None) -> None:
     """Log an error message with optional exception details."""
+    if not _should_log(ERROR):
+        return
     error_msg = f"ERROR: {msg}"
     if exception:
         error_msg += f" - Exception: {type(exception).__name__}: {str(exception)}"
@@ -23,19 +83,23 @@ def log_error(msg: str, prefix: str = "Hedwig", exception: Optional[Exception] =
 
 def log_warning(msg: str, prefix: str = "Hedwig") -> None:
     """Log a warning message."""
-    print(f"[{prefix}] WARNING: {msg}")
+    if _should_log(WARNING):
+        print(f"[{prefix}] WARNING: {msg}")
 
 
 def log_info(msg: str, prefix: str = "Hedwig") -> None:
     """Log an info message."""
-    print(f"[{prefix}] INFO: {msg}")
+    if _should_log(INFO):
+        print(f"[{prefix}] INFO: {msg}")
 
 
 def log_debug(msg: str, prefix: str = "Hedwig") -> None:
     """Log a debug message."""
-    print(f"[{prefix}] DEBUG: {msg}")
+    if _should_log(DEBUG):
+        print(f"[{prefix}] DEBUG: {msg}")
 
 
 def log_success(msg: str, prefix: str = "Hedwig") -> None:
     """Log a success message."""
-    print(f"[{prefix}] SUCCESS: {msg}") 
\ No newline at end of file
+    if _should_log(SUCCESS):
+        print(f"[{prefix}] SUCCESS: {msg}")
@@ -4,42 +4,73 @@ Text processing utilities for Hedwig.
 This module provides standardized text preprocessing functions for use across the application.
 """
 
+import functools
 import re
+from typing import Optional
+
+# Patterns compiled once at import rather than looked up in re's cache per call
+_WHITESPACE_RE = re.compile(r'\s+')
+_SPECIAL_CHARS_RE = re.compile(r'[^\w\s]')
+_SENTENCE_BOUNDARY_RE = re.compile(r'(?<=[.!?])\s+')
+# Match {placeholder}, <placeholder>, or [[placeholder]]
+_PLACEHOLDER_RE = re.compile(r'(\{[^}]+\}|<[^>]+>|\[\[[^\]]+\]\])')
+
+
+@functools.lru_cache(maxsize=32)
+def _special_chars_re(keep_chars: str) -> re.Pattern:
+    """Compile the special-character pattern for a given set of characters to keep."""
+    if not keep_chars:
+        return _SPECIAL_CHARS_RE
+    return re.compile(rf'[^\w\s{re.escape(keep_chars)}]')
+
+
+@functools.lru_cache(maxsize=32)
+def _special_chars_table(keep_chars: str) -> dict:
+    """Build a str.translate table deleting the ASCII characters _special_chars_re would remove."""
+    return {
+        code: None for code in range(128)
+        if not (chr(code).isalnum() or chr(code) == '_' or chr(code).isspace() or chr(code) in keep_chars)
+    }
+
 
 class TextProcessor:
     @staticmethod
     def preprocess_text(text: str) -> str:
         """Preprocess text by lowercasing, normalizing whitespace, and cleaning special characters (preserve hyphens)."""
-        text = text.lower()
-        text = TextProcessor.normalize_whitespace(text)
-        text = TextProcessor.clean_special_chars(text, keep_chars="-")
-        return text
+        # Same steps as normalize_whitespace then clean_special_chars(keep_chars="-"), so
+        # ASCII text gets the translate table instead of a second regex pass
+        return TextProcessor.clean_special_chars(_WHITESPACE_RE.sub(' ', text.lower()).strip(), keep_chars="-")
 
     @staticmethod
     def normalize_whitespace(text: str) -> str:
         """Replace multiple whitespace characters with a single space and strip leading/trailing whitespace."""
-        return re.sub(r'\s+', ' ', text).strip()
+        return _WHITESPACE_RE.sub(' ', text).strip()
 
     @staticmethod
     def clean_special_chars(text: str, keep_chars: str = "") -> str:
         """Remove special characters from text, except those in keep_chars."""
-        if keep_chars:
-            pattern = rf'[^\w\s{re.escape(keep_chars)}]'
-        else:
-            pattern = r'[^\w\s]'
-        return re.sub(pattern, '', text)
+        # ASCII text can be cleaned by a C-level table lookup; Unicode needs the regex's \w and \s
+        if text.isascii():
+            return text.translate(_special_chars_table(keep_chars))
+        return _special_chars_re(keep_chars).sub('', text)
 
     @staticmethod
     def extract_sentences(text: str) -> list:
         """Split text into sentences using simple punctuation rules."""
         # This is a simple sentence splitter; for more advanced, use nltk or spacy
-        sentences = re.split(r'(?<=[.!?])\s+', text.strip())
+        sentences = _SENTENCE_BOUNDARY_RE.split(text.strip())
         return [s for s in sentences if s]
 
     @staticmethod
-    def find_phrase_context(text: str, phrase: str, context_chars: int = 50) -> str:
-        """Find the context around a phrase in text (returns phrase with surrounding chars)."""
-        idx = text.lower().find(phrase.lower())
+    def find_phrase_context(text: str, phrase: str, context_chars: int = 50, text_lower: Optional[str] = None) -> str:
+        """Find the context around a phrase in text (returns phrase with surrounding chars).
+
+        Callers looking up several phrases in the same text can pass text_lower=text.lower()
+        so the text is only lowercased once.
+        """
+        if text_lower is None:
+            text_lower = text.lower()
+        idx = text_lower.find(phrase.lower())
         if idx == -1:
             return ""
         start = max(0, idx - context_chars)
@@ -54,6 +85,4 @@ class TextProcessor:
     @staticmethod
     def detect_placeholders(text: str) -> list:
         """Detect template placeholders in the text (e.g., {name}, <company>, etc.)."""
-        # Match {placeholder}, <placeholder>, or [[placeholder]]
-        pattern = r'(\{[^}]+\}|<[^>]+>|\[\[[^\]]+\]\])'
-        return re.findall(pattern, text) 
\ No newline at end of file
+        return _PLACEHOLDER_RE.findall(text) 
\ No newline at end of file
@@ -5,12 +5,48 @@ This module provides utilities for parsing YAML template files and extracting
 metadata, template content, and guidance components.
 """
 
+import copy
+import functools
+import os
 import yaml
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, FrozenSet, Optional
 from .error_utils import ErrorHandler
 from .logging_utils import log
 
+# Prefer the libyaml-backed loader; fall back to pure Python when libyaml is missing
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
+# Fields validate_template requires, checked with one subset test each
+_REQUIRED_SECTIONS: FrozenSet[str] = frozenset({'metadata', 'template'})
+_REQUIRED_METADATA_FIELDS: FrozenSet[str] = frozenset({'tags', 'use_case', 'tone', 'industry'})
+
+
+@dataclass(frozen=True, slots=True)
+class TemplateBundle:
+    """Every component extracted from one parsed template."""
+    metadata: Dict[str, Any]
+    guidance: Dict[str, Any]
+    content: str  # Subject line plus body, as returned by get_template_content
+    matching: str  # Tags, notes and content, as returned by get_matching_content
+
+
+@functools.lru_cache(maxsize=128)
+def _load_template_file(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse a template file once per (path, mtime, size); a changed file gets a new entry."""
+    with open(path, 'r', encoding='utf-8') as f:
+        return YAMLTemplateParser._check_required_sections(yaml.load(f, Loader=_SafeLoader))
+
+
+@functools.lru_cache(maxsize=128)
+def _load_template_text(text: str) -> Dict[str, Any]:
+    """Parse template text once per distinct content."""
+    return YAMLTemplateParser._check_required_sections(yaml.load(text, Loader=_SafeLoader))
+
 
 class YAMLTemplateParser:
     """Parse YAML template files and extract components."""
@@ -18,28 +54,32 @@ class YAMLTemplateParser:
     def parse_template(self, file_path: Path) -> Dict[str, Any]:
         """Parse YAML template file and return structured data."""
         def parse_file():
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
-            
-            # Validate required sections
-            required_sections = ['metadata', 'template']
-            for section in required_sections:
-                if section not in data:
-                    raise ValueError(f"Missing required section: {section}")
-            
-            return data
+            # Re-parse only when the file changed; callers get their own copy to mutate
+            stat = os.stat(file_path)
+            return copy.deepcopy(_load_template_file(str(file_path), stat.st_mtime_ns, stat.st_size))
         
         return ErrorHandler.handle_file_operation(parse_file)
     
+    def parse_template_from_string(self, text: str) -> Dict[str, Any]:
+        """Parse YAML template text that is already in memory and return structured data."""
+        def parse_text():
+            return copy.deepcopy(_load_template_text(text))
+        
+        return ErrorHandler.handle_file_operation(parse_text)
+    
+    @staticmethod
+    def _check_required_sections(data: Dict[str, Any]) -> Dict[str, Any]:
+        """Raise ValueError unless the parsed template has every required section."""
+        required_sections = ['metadata', 'template']
+        for section in required_sections:
+            if section not in data:
+                raise ValueError(f"Missing required section: {section}")
+        
+        return data
+    
     def get_template_content(self, yaml_data: Dict) -> str:
         """Extract template content for embedding generation."""
-        template = yaml_data.get('template', {})
-        subject = template.get('subject', '')
-        content = template.get('content', '')
-        
-        if subject:
-            return f"Subject: {subject}\n\n{content}"
-        return content
+        return self._template_content(yaml_data.get('template', {}))
     
     def get_metadata(self, yaml_data: Dict) -> Dict[str, Any]:
         """Extract metadata for filtering and organization."""
@@ -52,13 +92,11 @@ class YAMLTemplateParser:
     def validate_template(self, yaml_data: Dict) -> bool:
         """Validate template structure and required fields."""
         # Check required sections
-        if 'metadata' not in yaml_data or 'template' not in yaml_data:
+        if not _REQUIRED_SECTIONS.issubset(yaml_data):
             return False
         
         # Check required metadata fields
-        metadata = yaml_data['metadata']
-        required_fields = ['tags', 'use_case', 'tone', 'industry']
-        if not all(field in metadata for field in required_fields):
+        if not _REQUIRED_METADATA_FIELDS.issubset(yaml_data['metadata']):
             return False
         
         # Check template content
@@ -70,9 +108,32 @@ class YAMLTemplateParser:
     
     def get_matching_content(self, yaml_data: Dict) -> str:
         """Get content used for matching (tags, notes, and template content)."""
+        return self._matching_content(yaml_data.get('metadata', {}), yaml_data.get('template', {}))
+    
+    def extract_all(self, yaml_data: Dict) -> TemplateBundle:
+        """Extract metadata, guidance, template content and matching content in one pass."""
         metadata = yaml_data.get('metadata', {})
         template = yaml_data.get('template', {})
+        return TemplateBundle(
+            metadata=metadata,
+            guidance=yaml_data.get('guidance', {}),
+            content=self._template_content(template),
+            matching=self._matching_content(metadata, template)
+        )
+    
+    @staticmethod
+    def _template_content(template: Dict[str, Any]) -> str:
+        """Format a template section as its subject line followed by the body."""
+        subject = template.get('subject', '')
+        content = template.get('content', '')
         
+        if subject:
+            return f"Subject: {subject}\n\n{content}"
+        return content
+    
+    @staticmethod
+    def _matching_content(metadata: Dict[str, Any], template: Dict[str, Any]) -> str:
+        """Combine tags, notes, subject and content from already-extracted sections."""
         # Extract tags and notes for matching
         tags = metadata.get('tags', [])
         notes = metadata.get('notes', '')
@@ -98,4 +159,4 @@ class YAMLTemplateParser:
         if content:
             matching_parts.append(content)
         
-        return '\n\n'.join(matching_parts) 
\ No newline at end of file
+        return '\n\n'.join(matching_parts)